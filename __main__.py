@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 """Entry point for the brewhaul package."""
 
-from .cli import main
+import sys
+import os
+
+# Same setup as the brewhaul script, so both entry points run the one cli.main
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,19 +1,16 @@
 """Command-line interface for brewhaul."""
 
-import argparse
-from utils.ui import Colors, PerformanceTimer, subprocess_counter
-from core.detector import get_all_applications
-from providers.homebrew import check_homebrew_installed, get_brew_apps, get_brew_app_paths
-from commands.list import handle_list_command
-from commands.migrate import handle_migrate_command
+import sys
+from contextlib import nullcontext
+from types import SimpleNamespace
 
+_COMMANDS = ('list', 'migrate')
+_VALID_TYPES = frozenset(('manual', 'homebrew', 'appstore', 'all'))
+_MULTI_TYPES = ('manual', 'homebrew', 'appstore')  # What 'all' expands to
+_OUTPUT_FORMATS = ('table', 'json')
+_DEFAULT_PARALLEL = 3  # Concurrent migrations for a bare --parallel
 
-def parse_arguments():
-    """Parse command line arguments"""
-    parser = argparse.ArgumentParser(
-        description="Manage macOS applications by installation source",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_MAIN_EPILOG = """
 Examples:
   brewhaul list                    # List all applications by type
   brewhaul list --type manual      # List only manually installed apps
@@ -25,37 +22,174 @@ Examples:
 
 For more help on a command: brewhaul <command> --help
         """
-    )
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+_LIST_EPILOG = 'Examples:\n  brewhaul list\n  brewhaul list --type manual,homebrew\n  brewhaul list --format json'
+_MIGRATE_EPILOG = ('Examples:\n  brewhaul migrate --dry-run\n  brewhaul migrate\n  brewhaul migrate --auto\n'
+                   '  brewhaul migrate --auto --parallel 4')
+
+# Print per-phase timings; when off the phases aren't timed at all
+SHOW_TIMINGS = False
+
+# Flags understood by the fast parser, per command: (value flags, boolean flags)
+_FAST_FLAGS = {
+    'list': (('--type', '--format'), ()),
+    'migrate': (('--format', '--parallel'), ('--dry-run', '--auto', '--include-appstore')),
+}
+
+
+def _wants_help(argv):
+    """Check whether argv asks for help (argparse also accepts --help abbreviated)"""
+    return any(token == '-h' or (len(token) > 2 and '--help'.startswith(token)) for token in argv[1:])
+
+
+def _sniff_subcommand(argv):
+    """Return the subcommand named in argv, or None if there isn't one"""
+    for token in argv[1:]:
+        if token in _COMMANDS:
+            return token
+    return None
+
+
+def _phase_timer(description, *format_args):
+    """Time a phase of the command when SHOW_TIMINGS is enabled, otherwise do nothing
+
+    The description is only formatted with format_args when timings are shown.
+    """
+    if not SHOW_TIMINGS:
+        return nullcontext()
+
+    from utils.ui import PerformanceTimer
+    return PerformanceTimer(description.format(*format_args))
+
+
+def _expand_types(type_arg):
+    """Expand a --type value into the list of types to show
+
+    Returns:
+        Tuple of (types, invalid_types)
+    """
+    if ',' in type_arg:
+        # Split comma-separated values
+        types = [t.strip() for t in type_arg.split(',')]
+    elif type_arg == 'all':
+        types = _MULTI_TYPES
+    else:
+        types = [type_arg]
+    invalid_types = [t for t in types if t not in _VALID_TYPES]
+    return types, invalid_types
+
+
+def _fast_parse(argv):
+    """Parse the common command shapes without going through argparse
+
+    Returns None for anything out of the ordinary (help, unknown or abbreviated
+    flags, invalid values) so the caller can fall back to parse_arguments(),
+    which owns help output and error reporting.
+    """
+    if len(argv) < 2 or argv[1] not in _COMMANDS:
+        return None
+
+    command = argv[1]
+    if command == 'list':
+        args = SimpleNamespace(command='list', type='all', format='table')
+    else:
+        args = SimpleNamespace(command='migrate', dry_run=False, auto=False,
+                               format='table', include_appstore=False, parallel=1)
+    value_flags, bool_flags = _FAST_FLAGS[command]
+
+    tokens = iter(argv[2:])
+    for token in tokens:
+        flag, sep, value = token.partition('=')
+        if flag in value_flags:
+            if not sep:
+                value = next(tokens, None)
+                if value is None or value.startswith('-'):
+                    return None
+            setattr(args, flag[2:], value)
+        elif token in bool_flags:
+            setattr(args, token[2:].replace('-', '_'), True)
+        else:
+            return None
+
+    if args.format not in _OUTPUT_FORMATS:
+        return None
+
+    if command == 'migrate':
+        try:
+            args.parallel = int(args.parallel)
+        except ValueError:
+            return None
+        if args.parallel < 1:
+            return None
+
+    # Handlers read args.types directly, so it is always set
+    args.types = ()
+    if command == 'list':
+        types, invalid_types = _expand_types(args.type)
+        if invalid_types:
+            return None
+        args.types = types
+
+    return args
 
-    # List subcommand
+
+def _add_list_parser(subparsers, with_epilog=True):
+    """Add the list subcommand parser"""
     list_parser = subparsers.add_parser(
         'list',
         help='List applications by installation type',
         description='List applications categorized by their installation source',
-        epilog='Examples:\n  brewhaul list\n  brewhaul list --type manual,homebrew\n  brewhaul list --format json'
+        epilog=_LIST_EPILOG if with_epilog else None
     )
     list_parser.add_argument('--type',
                            default='all',
                            help='Filter by installation type: manual, homebrew, appstore, all, or comma-separated list (default: all)')
-    list_parser.add_argument('--format', choices=['table', 'json'], default='table',
+    list_parser.add_argument('--format', choices=_OUTPUT_FORMATS, default='table',
                            help='Output format (default: table)')
 
-    # Migrate subcommand (use --dry-run to preview migratable apps)
+
+def _add_migrate_parser(subparsers, with_epilog=True):
+    """Add the migrate subcommand parser (use --dry-run to preview migratable apps)"""
     migrate_parser = subparsers.add_parser(
         'migrate',
         help='Migrate manually installed apps to Homebrew',
         description='Migrate manually installed applications to Homebrew for easier management',
-        epilog='Examples:\n  brewhaul migrate --dry-run\n  brewhaul migrate\n  brewhaul migrate --auto'
+        epilog=_MIGRATE_EPILOG if with_epilog else None
     )
     migrate_parser.add_argument('--dry-run', action='store_true',
                               help='Show what would be migrated without making changes')
     migrate_parser.add_argument('--auto', action='store_true',
                               help='Automatically approve all migrations (non-interactive)')
-    migrate_parser.add_argument('--format', choices=['table', 'json'], default='table',
+    migrate_parser.add_argument('--format', choices=_OUTPUT_FORMATS, default='table',
                               help='Output format for dry-run (default: table)')
     migrate_parser.add_argument('--include-appstore', action='store_true',
                               help='Include App Store apps for migration to Homebrew (consolidate package management)')
+    migrate_parser.add_argument('--parallel', type=int, nargs='?', const=_DEFAULT_PARALLEL, default=1, metavar='N',
+                              help=f'With --auto, migrate N apps at a time (default without N: {_DEFAULT_PARALLEL})')
+
+
+def parse_arguments():
+    """Parse command line arguments"""
+    import argparse
+
+    # Only build the subparser that was requested; bare `brewhaul --help`
+    # still gets all of them so the global help lists every command
+    command = _sniff_subcommand(sys.argv)
+
+    # Epilogs (and the raw formatter that keeps their layout) only matter
+    # when help is actually printed
+    wants_help = _wants_help(sys.argv)
+    parser = argparse.ArgumentParser(
+        description="Manage macOS applications by installation source",
+        formatter_class=argparse.RawDescriptionHelpFormatter if wants_help else argparse.HelpFormatter,
+        epilog=_MAIN_EPILOG if wants_help else None
+    )
+    subparsers = parser.add_subparsers(dest='command', help='Available commands',
+                                       metavar='{' + ','.join(_COMMANDS) + '}')
+
+    if command in (None, 'list'):
+        _add_list_parser(subparsers, wants_help)
+    if command in (None, 'migrate'):
+        _add_migrate_parser(subparsers, wants_help)
 
     args = parser.parse_args()
 
@@ -65,69 +199,71 @@ For more help on a command: brewhaul <command> --help
         args.type = 'all'
         args.format = 'table'
 
-    # Process --type argument for list command
-    if args.command == 'list' and hasattr(args, 'type'):
-        valid_types = {'manual', 'homebrew', 'appstore', 'all'}
-        if ',' in args.type:
-            # Split comma-separated values and validate
-            types = [t.strip() for t in args.type.split(',')]
-            invalid_types = [t for t in types if t not in valid_types]
-            if invalid_types:
-                parser.error(f"Invalid type(s): {', '.join(invalid_types)}. Valid types are: {', '.join(valid_types)}")
-            # Store as list for processing
-            args.types = types
-        else:
-            # Single value - validate and convert to list
-            if args.type not in valid_types:
-                parser.error(f"Invalid type: {args.type}. Valid types are: {', '.join(valid_types)}")
-            args.types = [args.type] if args.type != 'all' else ['manual', 'homebrew', 'appstore']
+    if args.command == 'migrate' and args.parallel < 1:
+        parser.error(f"Invalid --parallel value: {args.parallel}. It must be at least 1")
+
+    # Process --type argument for list command; handlers read args.types
+    # directly, so it is always set
+    args.types = ()
+    if args.command == 'list':
+        types, invalid_types = _expand_types(args.type)
+        if invalid_types:
+            if ',' in args.type:
+                parser.error(f"Invalid type(s): {', '.join(invalid_types)}. Valid types are: {', '.join(_VALID_TYPES)}")
+            parser.error(f"Invalid type: {args.type}. Valid types are: {', '.join(_VALID_TYPES)}")
+        # Store as list for processing
+        args.types = types
 
     return args
 
 
 def main():
-    import sys
-
     # If no arguments provided, show help
     if len(sys.argv) == 1:
         sys.argv.append('--help')
 
-    args = parse_arguments()
+    # Common invocations are handled without argparse; help and errors fall back to it
+    args = _fast_parse(sys.argv)
+    if args is None:
+        args = parse_arguments()
+
+    # Heavy modules are imported only once argument parsing has succeeded so that
+    # --help and usage errors stay fast
+    from utils.ui import Colors, subprocess_counter
+    from core.detector import get_all_applications
+    from providers.homebrew import check_homebrew_installed, get_brew_app_paths
+    from providers.brew_cache import cached_brew_data
 
     # Reset subprocess counter for this run
     subprocess_counter.reset()
 
-    with PerformanceTimer(f"brewhaul {args.command} command", show_logs=False):
+    with _phase_timer("brewhaul {} command", args.command):
         # Display initial processing message
         print()  # Add newline before package manager message
         print(f"{Colors.BOLD}[*] macOS Package Manager{Colors.RESET}")
         print(f"{Colors.DIM}Analyzing your application installations...{Colors.RESET}")
 
         # Get all applications
-        with PerformanceTimer("Scanning applications directory", show_logs=False):
+        with _phase_timer("Scanning applications directory"):
             apps = get_all_applications()
 
-        # Get Homebrew data only for commands that need it
-        brew_cask_names = []
+        # Both list and migrate use the Homebrew app paths for fast classification;
+        # neither needs the installed cask names, so `brew list --cask` isn't run here
         brew_paths = []
         if check_homebrew_installed():
-            # Both list and migrate commands benefit from brew_paths for efficient classification
-            # List command also needs brew_cask_names
-            if args.command in ['list', 'migrate']:
-                with PerformanceTimer("Loading Homebrew data", show_logs=False):
-                    if args.command == 'list':
-                        brew_cask_names = get_brew_apps()
-                    brew_paths = get_brew_app_paths()
+            with _phase_timer("Loading Homebrew data"):
+                brew_paths = cached_brew_data('app-paths', get_brew_app_paths)
         else:
             print(f"{Colors.YELLOW}[!] Homebrew not detected - some features unavailable{Colors.RESET}")
 
         # Dispatch to appropriate handler based on command
-        with PerformanceTimer(f"Executing {args.command} command", show_logs=False):
+        with _phase_timer("Executing {} command", args.command):
             if args.command == 'list':
-                handle_list_command(args, apps, brew_cask_names, brew_paths)
+                from commands.list import handle_list_command
+                handle_list_command(args, apps, brew_paths)
             elif args.command == 'migrate':
-                handle_migrate_command(args, apps, brew_cask_names, brew_paths)
-
+                from commands.migrate import handle_migrate_command
+                handle_migrate_command(args, apps, brew_paths)
 
 
 if __name__ == "__main__":
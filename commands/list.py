@@ -1,11 +1,10 @@
 """List command implementation."""
 
-import json
-from utils.ui import Colors, TableFormatter
+from utils.ui import Colors, TableFormatter, JsonStreamWriter
 from core.detector import build_app_registry
 
 
-def handle_list_command(args, apps, brew_cask_names, brew_paths):
+def handle_list_command(args, apps, brew_paths):
     """Handle the list subcommand"""
     # Use centralized app registry for efficient classification
     print(f"{Colors.DIM}Classifying applications by installation type{Colors.RESET}")
@@ -19,22 +18,22 @@ def handle_list_command(args, apps, brew_cask_names, brew_paths):
     appstore_count = registry.appstore_count
     manual_count = registry.manual_count
 
-    # Use args.types if available (comma-separated support), otherwise fall back to args.type
-    types_to_show = getattr(args, 'types', [args.type] if args.type != 'all' else ['manual', 'homebrew', 'appstore'])
+    # Types to show, already expanded and validated by argument parsing
+    types_to_show = args.types
 
     if args.format == 'json':
-        result = {
-            'homebrew': brew_apps_list if 'homebrew' in types_to_show else [],
-            'appstore': appstore_apps_list if 'appstore' in types_to_show else [],
-            'manual': manual_apps_list if 'manual' in types_to_show else [],
-            'summary': {
-                'homebrew_count': brew_count,
-                'appstore_count': appstore_count,
-                'manual_count': manual_count,
-                'total': brew_count + appstore_count + manual_count
-            }
-        }
-        print(json.dumps(result, indent=2))
+        json_writer = JsonStreamWriter()
+        json_writer.start_object()
+        json_writer.write_member('homebrew', brew_apps_list if 'homebrew' in types_to_show else [])
+        json_writer.write_member('appstore', appstore_apps_list if 'appstore' in types_to_show else [])
+        json_writer.write_member('manual', manual_apps_list if 'manual' in types_to_show else [])
+        json_writer.write_member('summary', {
+            'homebrew_count': brew_count,
+            'appstore_count': appstore_count,
+            'manual_count': manual_count,
+            'total': brew_count + appstore_count + manual_count
+        })
+        json_writer.end_object()
         return
 
     # Table format output
@@ -55,8 +54,8 @@ def handle_list_command(args, apps, brew_cask_names, brew_paths):
         for app_name in manual_apps_list:
             table_rows.append((app_name, f"{Colors.YELLOW}Manual{Colors.RESET}"))
 
-    # Sort all apps alphabetically
-    table_rows.sort(key=lambda x: x[0].lower())
+    # Sort all apps alphabetically (casefold handles non-ASCII names correctly)
+    table_rows.sort(key=lambda x: x[0].casefold())
 
     # Print the table
     print(f"\n{Colors.BOLD}Applications by Installation Type:{Colors.RESET}")
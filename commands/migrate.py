@@ -1,50 +1,77 @@
 """Migrate command implementation."""
 
-import json
 import os
 import sys
-import re
-from utils.ui import Colors, TableFormatter, StatusIcons, SectionDivider, MigrationTable
+from concurrent.futures import ThreadPoolExecutor
+from utils.ui import Colors, TableFormatter, StatusIcons, SectionDivider, MigrationTable, JsonStreamWriter, _visible_len
 from core.detector import build_app_registry
-from core.manager import is_app_running
-from core.migrator import migrate_manual_apps_to_brew
+from core.manager import is_app_running, get_running_app_names
+from core.migrator import migrate_manual_apps_to_brew, MAX_LOOKUP_WORKERS
 from providers.homebrew import check_brew_equivalent_with_api
 
 
-def handle_migrate_command(args, apps, brew_cask_names=None, brew_paths=None):
+def _check_migration_candidates(app_names, app_paths, api, check_running='matched'):
+    """Look up Homebrew equivalents and running state for apps concurrently
+
+    Args:
+        app_names: List of app names to check
+        app_paths: Dict mapping app names to paths
+        api: Loaded HomebrewAPI instance (read-only once loaded, safe to share)
+        check_running: Which apps to check running state for: 'all', 'matched'
+            (only apps with a Homebrew equivalent) or 'none'
+
+    Yields:
+        (app_name, casks, is_running) tuples in the same order as app_names
+    """
+    # One process listing answers the running check for every app
+    running_apps = get_running_app_names() if check_running != 'none' else None
+
+    def check(app_name):
+        casks = check_brew_equivalent_with_api(app_name, app_paths.get(app_name), api)
+        if check_running == 'all' or (casks and check_running == 'matched'):
+            is_running = is_app_running(app_name, running_apps)
+        else:
+            is_running = False
+        return app_name, casks, is_running
+
+    if not app_names:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_LOOKUP_WORKERS, len(app_names))) as executor:
+        yield from executor.map(check, app_names)
+
+
+def handle_migrate_command(args, apps, brew_paths=None):
     """Handle the migrate subcommand"""
     from providers.homebrew import check_homebrew_installed
-    from providers.homebrew_api import HomebrewAPI
+    from providers.homebrew_api import get_api
 
     if not check_homebrew_installed():
         print(f"{Colors.YELLOW}Homebrew is not installed. Cannot migrate applications.{Colors.RESET}")
         return
 
-    # Initialize Homebrew API once for all operations
-    api = HomebrewAPI()
-    api.load_data()  # Load data once upfront
-
     # Use the centralized app registry for efficient classification
     sys.stdout.write(f"{Colors.DIM}Classifying applications by installation type{Colors.RESET}\n")
     sys.stdout.flush()
     registry = build_app_registry(apps, brew_paths, show_progress=True)
 
-    # Determine which apps to include for migration
-    migration_candidates = registry.manual_apps[:]  # Copy the list
-    migration_app_paths = registry.manual_app_paths.copy()
+    include_appstore = args.include_appstore
 
-    # Include App Store apps if requested
-    if getattr(args, 'include_appstore', False):
+    # Determine which apps to include for migration
+    if include_appstore:
         print(f"{Colors.BLUE}Including App Store apps for migration (--include-appstore flag detected){Colors.RESET}")
+        migration_candidates = sorted(registry.manual_apps + registry.appstore_apps)
+        migration_app_paths = dict(registry.manual_app_paths)
         for app_name in registry.appstore_apps:
-            migration_candidates.append(app_name)
             # Reconstruct path for App Store apps (they follow the same pattern)
             migration_app_paths[app_name] = os.path.join("/Applications", app_name)
-
-    migration_candidates.sort()
+    else:
+        # The registry's lists are already sorted and are only read from here on
+        migration_candidates = registry.manual_apps
+        migration_app_paths = registry.manual_app_paths
 
     if not migration_candidates:
-        if getattr(args, 'include_appstore', False):
+        if include_appstore:
             print(f"{Colors.YELLOW}No manually installed or App Store applications found to migrate.{Colors.RESET}")
         else:
             print(f"{Colors.YELLOW}No manually installed applications found to migrate.{Colors.RESET}")
@@ -55,45 +82,53 @@ def handle_migrate_command(args, apps, brew_cask_names=None, brew_paths=None):
     manual_apps_list = migration_candidates
     manual_app_paths = migration_app_paths
 
+    # Make sure the shared Homebrew API data is loaded, now that there is something
+    # to look up. Load it before the lookups fan out to worker threads so they
+    # don't each trigger a load of their own
+    api = get_api()
+    api.ensure_loaded()
+
     if args.dry_run:
         # Check if we need JSON format
         if args.format == 'json':
-            result = {
-                'dry_run': True,
-                'apps_to_migrate': {},
-                'summary': {
-                    'total_manual_apps': len(manual_apps_list),
-                    'can_migrate': 0,
-                    'cannot_migrate': 0,
-                    'currently_running': 0
-                }
+            # Stream each app's entry as soon as it has been checked
+            summary = {
+                'total_manual_apps': len(manual_apps_list),
+                'can_migrate': 0,
+                'cannot_migrate': 0,
+                'currently_running': 0
             }
+            json_writer = JsonStreamWriter()
+            json_writer.start_object()
+            json_writer.write_member('dry_run', True)
+            json_writer.start_object('apps_to_migrate')
 
-            for app_name in manual_apps_list:
-                app_path = manual_app_paths.get(app_name)
-                casks = check_brew_equivalent_with_api(app_name, app_path, api)
-                is_running = is_app_running(app_name)
-
+            checked_apps = _check_migration_candidates(
+                manual_apps_list, manual_app_paths, api, check_running='all'
+            )
+            for app_name, casks, is_running in checked_apps:
                 if casks:
-                    result['apps_to_migrate'][app_name] = {
+                    json_writer.write_member(app_name, {
                         'can_migrate': True,
                         'homebrew_equivalent': casks[0][0],
                         'is_running': is_running,
                         'status': 'running' if is_running else 'ready'
-                    }
-                    result['summary']['can_migrate'] += 1
+                    })
+                    summary['can_migrate'] += 1
                     if is_running:
-                        result['summary']['currently_running'] += 1
+                        summary['currently_running'] += 1
                 else:
-                    result['apps_to_migrate'][app_name] = {
+                    json_writer.write_member(app_name, {
                         'can_migrate': False,
                         'homebrew_equivalent': None,
                         'is_running': is_running,
                         'status': 'no_equivalent'
-                    }
-                    result['summary']['cannot_migrate'] += 1
+                    })
+                    summary['cannot_migrate'] += 1
 
-            print(json.dumps(result, indent=2))
+            json_writer.end_object()
+            json_writer.write_member('summary', summary)
+            json_writer.end_object()
         else:
             # Progressive table output
             formatter = TableFormatter()
@@ -111,25 +146,20 @@ def handle_migrate_command(args, apps, brew_cask_names=None, brew_paths=None):
                 max(10, len(headers[2]))   # Status column
             ]
 
-            # Build and print the table header
-            def format_row(values, widths, use_heavy=False):
-                cells = []
-                for i, val in enumerate(values):
-                    if i < len(widths):
-                        # Remove ANSI codes for width calculation
-                        clean_val = re.sub(r'\033\[[0-9;]*m', '', str(val))
-                        padding = widths[i] - len(clean_val)
-                        cells.append(f" {val}{' ' * padding} ")
-                border_char = "┃" if use_heavy else "│"
-                return border_char + border_char.join(cells) + border_char
+            # Build the row templates once; cells are padded to their visible width
+            header_template = "┃ " + " ┃ ".join(["{}"] * len(col_widths)) + " ┃"
+            row_template = "│ " + " │ ".join(["{}"] * len(col_widths)) + " │"
+
+            def pad_cells(values):
+                # Ignore ANSI codes for width calculation
+                return [val + " " * (width - _visible_len(val)) for val, width in zip(values, col_widths)]
 
             # Print header
-            header_row = format_row(headers, col_widths, use_heavy=True)
             border_top = "┏" + "┳".join("━" * (w + 2) for w in col_widths) + "┓"
             border_mid = "┡" + "╇".join("━" * (w + 2) for w in col_widths) + "┩"
 
             print(border_top)
-            print(header_row)
+            print(header_template.format(*pad_cells(headers)))
             print(border_mid)
 
             # Process apps and display progressively
@@ -137,24 +167,30 @@ def handle_migrate_command(args, apps, brew_cask_names=None, brew_paths=None):
             migratable_count = 0
             total_apps = len(manual_apps_list)
 
-            for i, app_name in enumerate(manual_apps_list):
-                # Show checking status with proper width calculation
-                progress_msg = f"Checking {i+1}/{total_apps}: {app_name[:40]}..."
-                # Calculate the exact width of the table row
-                row_width = sum(col_widths) + len(col_widths) * 3 + 1  # cells + separators + borders
-                # Create a full-width progress message that matches table structure
-                inner_width = row_width - 3  # Subtract the two border characters and leading space
+            # Lookups run ahead in the background; rows are still shown in order
+            checked_apps = _check_migration_candidates(manual_apps_list, manual_app_paths, api)
+
+            # Calculate the exact width of the table row
+            row_width = sum(col_widths) + len(col_widths) * 3 + 1  # cells + separators + borders
+            # Progress messages span the full row to match the table structure
+            inner_width = row_width - 3  # Subtract the two border characters and leading space
+
+            def progress_row(i):
+                # Dimmed full-width row showing which app is being checked
+                progress_msg = f"Checking {i+1}/{total_apps}: {manual_apps_list[i][:40]}..."
                 padded_msg = progress_msg[:inner_width].ljust(inner_width)
-                sys.stdout.write(f"\r│ {Colors.DIM}{padded_msg}{Colors.RESET}│\r")
-                sys.stdout.flush()
+                return f"\r│ {Colors.DIM}{padded_msg}{Colors.RESET}│\r"
 
-                app_path = manual_app_paths.get(app_name)
-                casks = check_brew_equivalent_with_api(app_name, app_path, api)
+            sys.stdout.write(progress_row(0))
+            sys.stdout.flush()
+
+            for i, app_name in enumerate(manual_apps_list):
+                _, casks, app_running = next(checked_apps)
 
                 # Prepare row data
                 if casks:
                     cask_name = casks[0][0]  # Use first match
-                    if is_app_running(app_name):
+                    if app_running:
                         status = f"{Colors.YELLOW}Running{Colors.RESET}"
                     else:
                         status = f"{Colors.GREEN}Ready{Colors.RESET}"
@@ -169,10 +205,13 @@ def handle_migrate_command(args, apps, brew_cask_names=None, brew_paths=None):
 
                 table_rows.append(row)
 
-                # Clear the entire line before printing the row
-                sys.stdout.write("\r" + " " * row_width + "\r")
+                # Clear the progress line, print the row and show the next app's
+                # progress in a single write
+                output = "\r" + " " * row_width + "\r" + row_template.format(*pad_cells(row)) + "\n"
+                if i + 1 < total_apps:
+                    output += progress_row(i + 1)
+                sys.stdout.write(output)
                 sys.stdout.flush()
-                print(format_row(row, col_widths, use_heavy=False))
 
             # Close the table
             border_bottom = "└" + "┴".join("─" * (w + 2) for w in col_widths) + "┘"
@@ -196,7 +235,7 @@ def handle_migrate_command(args, apps, brew_cask_names=None, brew_paths=None):
                 f"{no_equivalent_count} ({no_equivalent_percentage:.1f}%)"
             ))
 
-            if getattr(args, 'include_appstore', False):
+            if include_appstore:
                 manual_count = len(registry.manual_apps)
                 appstore_count = len(registry.appstore_apps)
                 summary_rows.append((
@@ -220,21 +259,25 @@ def handle_migrate_command(args, apps, brew_cask_names=None, brew_paths=None):
             )
             print(summary_table)
 
-            if not getattr(args, 'include_appstore', False) and registry.appstore_apps:
+            if not include_appstore and registry.appstore_apps:
                 print(f"\n{StatusIcons.INFO} {Colors.DIM}Tip: Use --include-appstore to also migrate App Store apps{Colors.RESET}")
         return
 
     # Separate apps with and without Homebrew packages
     migratable_apps = []
     migratable_app_paths = {}
+    app_casks = {}
     apps_without_matches = []
 
-    for app_name in manual_apps_list:
-        app_path = manual_app_paths.get(app_name)
-        casks = check_brew_equivalent_with_api(app_name, app_path, api)
+    # Resolve every app's Homebrew equivalents once; the migrator reuses them
+    checked_apps = _check_migration_candidates(
+        manual_apps_list, manual_app_paths, api, check_running='none'
+    )
+    for app_name, casks, _ in checked_apps:
         if casks:  # Has Homebrew equivalent
             migratable_apps.append(app_name)
             migratable_app_paths[app_name] = manual_app_paths[app_name]
+            app_casks[app_name] = casks
         else:
             apps_without_matches.append(app_name)
 
@@ -252,7 +295,9 @@ def handle_migrate_command(args, apps, brew_cask_names=None, brew_paths=None):
         migratable_apps,
         migratable_app_paths,
         auto_approve=args.auto,
-        apps_without_matches=apps_without_matches
+        apps_without_matches=apps_without_matches,
+        app_casks=app_casks,
+        max_parallel=args.parallel
     )
 
     # Summary is now handled in migrator.py with the final table display
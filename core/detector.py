@@ -1,48 +1,76 @@
 """Application detection and classification functionality."""
 
 import os
-import subprocess
+import sys
 import logging
-from typing import Dict, List, Tuple, NamedTuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Collection, Dict, List, Set, Tuple, Optional
 
 from utils.ui import progress_wrapper, ProgressIndicator
 
+if TYPE_CHECKING:
+    from providers.homebrew_api import HomebrewAPI
+
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent app classifications (each may spawn mas/mdls subprocesses)
+MAX_CLASSIFY_WORKERS = 32
+
+
+@dataclass(frozen=True)
+class AppRegistry:
+    """Structured registry containing categorized applications.
 
-class AppRegistry(NamedTuple):
-    """Structured registry containing categorized applications."""
-    homebrew_apps: List[str]
-    appstore_apps: List[str]
-    manual_apps: List[str]
+    The app name tuples are sorted; counts are derived from them.
+    """
+    __slots__ = ('homebrew_apps', 'appstore_apps', 'manual_apps', 'manual_app_paths')
+
+    homebrew_apps: Tuple[str, ...]
+    appstore_apps: Tuple[str, ...]
+    manual_apps: Tuple[str, ...]
     manual_app_paths: Dict[str, str]
-    homebrew_count: int
-    appstore_count: int
-    manual_count: int
-    total_count: int
+
+    @property
+    def homebrew_count(self) -> int:
+        return len(self.homebrew_apps)
+
+    @property
+    def appstore_count(self) -> int:
+        return len(self.appstore_apps)
+
+    @property
+    def manual_count(self) -> int:
+        return len(self.manual_apps)
+
+    @property
+    def total_count(self) -> int:
+        return len(self.homebrew_apps) + len(self.appstore_apps) + len(self.manual_apps)
 
 
 def get_all_applications():
     """Get all applications in /Applications directory with progress and error handling"""
     def _scan_applications():
         try:
-            if not os.path.exists("/Applications"):
-                logger.error("/Applications directory does not exist")
-                return []
-
+            # scandir reads the directory in batches (with entry types included),
+            # so the whole scan is a handful of syscalls
             apps = []
-            for item in os.listdir("/Applications"):
-                if item.endswith(".app"):
-                    app_path = os.path.join("/Applications", item)
-                    # Verify the .app is actually a directory
-                    if os.path.isdir(app_path):
-                        apps.append(app_path)
-                    else:
-                        logger.warning(f"Skipping {item} - not a valid application bundle")
+            with os.scandir("/Applications") as entries:
+                for entry in entries:
+                    if entry.name.endswith(".app"):
+                        # Verify the .app is actually a directory (served from the
+                        # directory listing unless the entry is a symlink)
+                        if entry.is_dir():
+                            apps.append(entry.path)
+                        else:
+                            logger.warning(f"Skipping {entry.name} - not a valid application bundle")
 
             logger.info(f"Found {len(apps)} applications in /Applications")
             return sorted(apps)
+        except FileNotFoundError:
+            logger.error("/Applications directory does not exist")
+            return []
         except PermissionError:
             logger.error("Permission denied accessing /Applications directory")
             return []
@@ -56,22 +84,61 @@ def get_all_applications():
     return progress_wrapper("Scanning /Applications directory", _scan_applications)
 
 
-def is_appstore_app(app_path):
-    """Enhanced check if an app is from the Mac App Store using multiple methods with error handling"""
+def _list_contents(app_path: str) -> Optional[Set[str]]:
+    """
+    List the names in an app bundle's Contents directory with a single scan
+
+    Returns:
+        Set of entry names (empty if the bundle has no Contents directory),
+        or None if the app path does not exist
+    """
     try:
-        if not app_path or not os.path.exists(app_path):
-            logger.warning(f"App path does not exist: {app_path}")
-            return False
+        with os.scandir(os.path.join(app_path, "Contents")) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set() if os.path.isdir(app_path) else None
+    except NotADirectoryError:
+        return set()
+    except OSError as e:
+        logger.debug(f"Could not list contents of {app_path}: {e}")
+        return set()
+
+
+def is_appstore_app(app_path: str, contents_names: Optional[Set[str]] = None,
+                    mas_names: Optional[Set[str]] = None, app_name: Optional[str] = None) -> bool:
+    """Enhanced check if an app is from the Mac App Store using multiple methods with error handling
+
+    contents_names, if given, is the set of names in the app's Contents
+    directory (see _list_contents); otherwise Contents is listed here.
+    mas_names, if given, is the set of lowercased names from `mas list`
+    (see get_mas_installed_names) and replaces the per-app `mas search`.
+    app_name, if given, is the app's file name (the basename of app_path).
+    """
+    try:
+        if contents_names is None:
+            # One listing of Contents both validates the path and answers the
+            # receipt check
+            contents_names = _list_contents(app_path) if app_path else None
+            if contents_names is None:
+                logger.warning(f"App path does not exist: {app_path}")
+                return False
 
-        app_name = os.path.basename(app_path)
+        if app_name is None:
+            app_name = os.path.basename(app_path)
 
         # Method 1: Check for Mac App Store receipt (most reliable)
-        receipt_path = os.path.join(app_path, "Contents", "_MASReceipt")
-        if os.path.isdir(receipt_path):
+        if "_MASReceipt" in contents_names:
             logger.debug(f"Found MAS receipt for {app_name}")
             return True
 
-        # Method 2: Check using mas search if available (for edge cases)
+        # Method 2: Check against the installed App Store apps when known
+        if mas_names is not None:
+            if app_name.replace(".app", "").lower() in mas_names:
+                logger.debug(f"Found {app_name} in installed App Store apps")
+                return True
+            return False
+
+        # Method 3: Check using mas search if available (for edge cases)
         from providers.appstore import check_mas_installed, is_mas_app_by_search
         try:
             if check_mas_installed():
@@ -87,14 +154,26 @@ def is_appstore_app(app_path):
         return False
 
 
-def is_brew_app(app_path, brew_apps=None, brew_paths=None):
+def is_brew_app(app_path: str, *, brew_paths: Optional[Collection[str]] = None,
+                bundle_id: Optional[str] = None, api: Optional["HomebrewAPI"] = None,
+                installed_tokens: Optional[Set[str]] = None,
+                contents_names: Optional[Set[str]] = None, app_name: Optional[str] = None) -> bool:
     """
     Check if an app is installed via Homebrew using API-based detection
 
     Args:
         app_path: Full path to the application
-        brew_apps: List of Homebrew cask names (optional, for backward compatibility)
-        brew_paths: List of paths to Homebrew installed applications (optional)
+        brew_paths: Paths of Homebrew installed applications (optional, pass a
+            set when checking many apps so the lookup is a hash probe)
+        bundle_id: Bundle identifier of the app if already known (optional,
+            looked up from the app otherwise)
+        api: Loaded HomebrewAPI instance to reuse (optional, the shared
+            instance is used otherwise)
+        installed_tokens: Set of installed cask tokens (optional, the cached
+            `brew list --cask` result is used otherwise)
+        contents_names: Set of names in the app's Contents directory (optional,
+            Contents is listed here otherwise)
+        app_name: File name of the app, i.e. the basename of app_path (optional)
 
     Returns:
         bool: True if app is installed via Homebrew, False otherwise
@@ -103,44 +182,131 @@ def is_brew_app(app_path, brew_apps=None, brew_paths=None):
     if brew_paths and app_path in brew_paths:
         return True
 
+    # Check for Homebrew metadata files (local and cheap, so before any lookups).
+    # One listing of Contents replaces a stat per receipt path
+    if contents_names is None:
+        contents_names = _list_contents(app_path) or set()
+    if ".brew_receipt" in contents_names:
+        return True
+    if "MacOS" in contents_names and os.path.exists(os.path.join(app_path, "Contents", "MacOS", ".brew")):
+        return True
+
     # Use API-based detection for accurate matching
-    from providers.homebrew_api import HomebrewAPI
+    from providers.homebrew_api import get_api
     from providers.homebrew_installed import is_cask_installed
-    from utils.app_metadata import get_bundle_identifier
 
-    app_name = os.path.basename(app_path).replace(".app", "")
+    if app_name is None:
+        app_name = os.path.basename(app_path)
+
+    if api is None:
+        api = get_api()
+
+    if installed_tokens is not None:
+        is_installed = installed_tokens.__contains__
+    else:
+        is_installed = is_cask_installed
+
+    return _has_installed_cask(api, app_path, app_name, bundle_id, is_installed)
 
-    api = HomebrewAPI()
 
+def _has_installed_cask(api: "HomebrewAPI", app_path: str, app_name: str,
+                        bundle_id: Optional[str], is_installed: Callable[[str], bool]) -> bool:
+    """
+    Check whether an installed Homebrew cask matches the app by name or bundle ID
+
+    Args:
+        api: Loaded HomebrewAPI instance
+        app_path: Full path to the application
+        app_name: File name of the app
+        bundle_id: Bundle identifier of the app, looked up from the app if None
+        is_installed: Callable telling whether a cask token is installed
+    """
     # Check via API name matching
-    result = api.find_cask_for_app(app_name)
+    result = api.find_cask_for_app(app_name.replace(".app", ""))
     if result:
         # Verify the cask is actually installed
         token, _ = result
-        if is_cask_installed(token):
+        if is_installed(token):
             return True
 
     # Check via bundle identifier
-    bundle_id = get_bundle_identifier(app_path)
+    if not bundle_id:
+        from utils.app_metadata import get_bundle_identifier
+        bundle_id = get_bundle_identifier(app_path)
     if bundle_id:
         result = api.find_cask_by_bundle_id(bundle_id)
         if result:
             # Verify the cask is actually installed
             token, _ = result
-            if is_cask_installed(token):
+            if is_installed(token):
                 return True
 
-    # Fallback: Check if app has Homebrew metadata files
-    receipt_paths = [
-        os.path.join(app_path, "Contents", ".brew_receipt"),
-        os.path.join(app_path, "Contents", "MacOS", ".brew")
-    ]
+    return False
 
-    for receipt_path in receipt_paths:
-        if os.path.exists(receipt_path):
-            return True
 
-    return False
+def _classify_app(app_path: str, brew_paths_set: Set[str], api: "HomebrewAPI", installed_tokens: Set[str],
+                  mas_names: Set[str], bundle_id: Optional[str] = None) -> Optional[Tuple[str, str, str]]:
+    """
+    Classify a single application by installation type.
+
+    Performs the same checks as is_appstore_app and is_brew_app in a single
+    pass, answering every receipt check from one listing of Contents.
+
+    Args:
+        app_path: Path to the application
+        brew_paths_set: Set of known Homebrew application paths for fast lookup
+        api: Loaded HomebrewAPI instance shared by all classifications
+        installed_tokens: Set of installed cask tokens
+        mas_names: Set of lowercased names of apps installed from the App Store
+        bundle_id: Prefetched bundle identifier of the app, if known
+
+    Returns:
+        Tuple of (category, app_name, app_path) where category is 'homebrew',
+        'appstore' or 'manual', or None if the app path is invalid. Errors are
+        logged rather than raised.
+    """
+    app_name = os.path.basename(app_path)
+
+    # A single handler for every check below; an app that can't be checked
+    # counts as manually installed
+    try:
+        # Validate app path before processing; listing Contents once also answers
+        # the receipt checks below
+        contents_names = _list_contents(app_path) if app_path else None
+        if contents_names is None:
+            logger.warning(f"Skipping invalid app path: {app_path}")
+            return None
+
+        # Fast path: Check if app is in known Homebrew paths
+        if brew_paths_set and app_path in brew_paths_set:
+            logger.debug(f"Classified {app_name} as Homebrew (fast path)")
+            return ('homebrew', app_name, app_path)
+
+        # Check App Store first (usually faster than Homebrew API checks): the
+        # receipt, then the apps `mas list` reported
+        if "_MASReceipt" in contents_names or app_name.replace(".app", "").lower() in mas_names:
+            logger.debug(f"Classified {app_name} as App Store")
+            return ('appstore', app_name, app_path)
+
+        # Check for Homebrew metadata files
+        if ".brew_receipt" in contents_names or (
+                "MacOS" in contents_names
+                and os.path.exists(os.path.join(app_path, "Contents", "MacOS", ".brew"))):
+            logger.debug(f"Classified {app_name} as Homebrew (receipt)")
+            return ('homebrew', app_name, app_path)
+
+        # Check for an installed cask matching the app
+        if _has_installed_cask(api, app_path, app_name, bundle_id, installed_tokens.__contains__):
+            logger.debug(f"Classified {app_name} as Homebrew")
+            return ('homebrew', app_name, app_path)
+
+        # If not Homebrew or App Store, it's manually installed
+        logger.debug(f"Classified {app_name} as manual install")
+        return ('manual', app_name, app_path)
+
+    except Exception as e:
+        logger.warning(f"Error classifying {app_name}, treating it as manually installed: {e}")
+        return ('manual', app_name, app_path)
 
 
 def build_app_registry(apps: List[str], brew_paths: Optional[List[str]] = None,
@@ -150,8 +316,7 @@ def build_app_registry(apps: List[str], brew_paths: Optional[List[str]] = None,
 
     This function performs a single efficient pass through all applications and
     classifies them as Homebrew, App Store, or manually installed applications.
-    It's significantly more efficient than the old classify_apps() function as it
-    uses cached Homebrew data and performs O(n) classification.
+    It uses cached Homebrew data and performs O(n) classification.
 
     Args:
         apps: List of application paths to classify
@@ -164,7 +329,13 @@ def build_app_registry(apps: List[str], brew_paths: Optional[List[str]] = None,
     Performance:
         - Time Complexity: O(n) where n is the number of applications
         - Uses cached Homebrew paths for fast lookup when available
-        - Single pass through all applications
+        - Bundle identifiers are fetched for all apps at once with
+          get_app_metadata_batch (Info.plist, cached across runs)
+        - One HomebrewAPI instance and one installed cask listing are shared
+          by every app, so per-app Homebrew checks are dictionary/set lookups
+        - App Store apps are listed with one `mas list` call up front
+        - Apps are classified concurrently (up to MAX_CLASSIFY_WORKERS at a time),
+          since each check is dominated by subprocess and filesystem I/O
         - Minimizes API calls through efficient detection logic
     """
     homebrew_apps = []
@@ -181,51 +352,59 @@ def build_app_registry(apps: List[str], brew_paths: Optional[List[str]] = None,
         progress.start()
 
     try:
-        for i, app_path in enumerate(apps):
-            try:
-                app_name = os.path.basename(app_path)
-
-                if progress:
-                    progress.update(current=i, message=f"{app_name}")
-
-                # Validate app path before processing
-                if not app_path or not os.path.exists(app_path):
-                    logger.warning(f"Skipping invalid app path: {app_path}")
+        if apps:
+            # Bundle IDs for every app that may need one, read from Info.plist
+            # or the metadata cache, with at most one mdls call for the rest
+            from utils.app_metadata import get_app_metadata_batch
+            app_metadata = get_app_metadata_batch([app for app in apps if app not in brew_paths_set])
+            bundle_ids = {path: metadata['bundle_id'] for path, metadata in app_metadata.items()}
+
+            # Load the cask data before the workers start so they don't race
+            # to load it themselves
+            from providers.homebrew_api import get_api
+            from providers.homebrew_installed import list_installed_cask_tokens
+
+            api = get_api()
+            api.ensure_loaded()
+            installed_tokens = list_installed_cask_tokens()
+
+            from providers.appstore import check_mas_installed, get_mas_installed_names
+            mas_names = get_mas_installed_names() if check_mas_installed() else set()
+
+            # Results are stored by position so the category lists come out in
+            # the same order as apps, whatever order the workers finish in
+            results = [None] * len(apps)
+
+            with ThreadPoolExecutor(max_workers=min(MAX_CLASSIFY_WORKERS, len(apps))) as executor:
+                futures = {
+                    executor.submit(_classify_app, app_path, brew_paths_set, api, installed_tokens,
+                                    mas_names, bundle_ids.get(app_path)): index
+                    for index, app_path in enumerate(apps)
+                }
+
+                # _classify_app handles its own errors, so one failing app
+                # doesn't stop the others
+                for done, future in enumerate(as_completed(futures), start=1):
+                    index = futures[future]
+                    results[index] = future.result()
+
+                    if progress:
+                        progress.update(current=done, message=os.path.basename(apps[index]))
+
+            for result in results:
+                if result is None:
                     continue
 
-                # Fast path: Check if app is in known Homebrew paths
-                if brew_paths_set and app_path in brew_paths_set:
+                category, app_name, app_path = result
+                # Names are looked up and compared repeatedly downstream
+                app_name = sys.intern(app_name)
+                if category == 'homebrew':
                     homebrew_apps.append(app_name)
-                    logger.debug(f"Classified {app_name} as Homebrew (fast path)")
-                    continue
-
-                # Check App Store first (usually faster than Homebrew API checks)
-                try:
-                    if is_appstore_app(app_path):
-                        appstore_apps.append(app_name)
-                        logger.debug(f"Classified {app_name} as App Store")
-                        continue
-                except Exception as e:
-                    logger.warning(f"Error checking App Store status for {app_name}: {e}")
-
-                # Check Homebrew (with brew_paths for efficiency)
-                try:
-                    if is_brew_app(app_path, brew_paths=list(brew_paths_set) if brew_paths_set else None):
-                        homebrew_apps.append(app_name)
-                        logger.debug(f"Classified {app_name} as Homebrew")
-                        continue
-                except Exception as e:
-                    logger.warning(f"Error checking Homebrew status for {app_name}: {e}")
-
-                # If not Homebrew or App Store, it's manually installed
-                manual_apps.append(app_name)
-                manual_app_paths[app_name] = app_path
-                logger.debug(f"Classified {app_name} as manual install")
-
-            except Exception as e:
-                logger.error(f"Error processing app {app_path}: {e}")
-                # Continue with next app instead of failing completely
-                continue
+                elif category == 'appstore':
+                    appstore_apps.append(app_name)
+                else:
+                    manual_apps.append(app_name)
+                    manual_app_paths[app_name] = app_path
 
         if progress:
             progress.update(current=len(apps))
@@ -238,67 +417,16 @@ def build_app_registry(apps: List[str], brew_paths: Optional[List[str]] = None,
             progress.stop(f"Classification failed: {str(e)}")
         raise RuntimeError(error_msg) from e
 
-    # Sort all lists alphabetically for consistent output
+    # Sort all lists alphabetically for consistent output. apps usually comes
+    # sorted from get_all_applications, in which case each list is already in
+    # order and the sort is a single linear pass
     homebrew_apps.sort()
     appstore_apps.sort()
     manual_apps.sort()
 
-    # Calculate counts
-    homebrew_count = len(homebrew_apps)
-    appstore_count = len(appstore_apps)
-    manual_count = len(manual_apps)
-    total_count = homebrew_count + appstore_count + manual_count
-
     return AppRegistry(
-        homebrew_apps=homebrew_apps,
-        appstore_apps=appstore_apps,
-        manual_apps=manual_apps,
-        manual_app_paths=manual_app_paths,
-        homebrew_count=homebrew_count,
-        appstore_count=appstore_count,
-        manual_count=manual_count,
-        total_count=total_count
-    )
-
-
-def classify_apps(apps, brew_cask_names, brew_paths):
-    """
-    Classify all applications by installation type.
-
-    DEPRECATED: Use build_app_registry() instead for better performance.
-    This function is kept for backward compatibility but will be removed in a future version.
-
-    Returns:
-        tuple: (brew_apps_list, appstore_apps_list, manual_apps_list, manual_app_paths,
-                brew_count, appstore_count, manual_count)
-    """
-    brew_apps_list = []
-    appstore_apps_list = []
-    manual_apps_list = []
-    manual_app_paths = {}
-
-    brew_count = 0
-    appstore_count = 0
-    manual_count = 0
-
-    for app in apps:
-        app_name = os.path.basename(app)
-
-        if is_brew_app(app, brew_cask_names, brew_paths):
-            brew_apps_list.append(app_name)
-            brew_count += 1
-        elif is_appstore_app(app):
-            appstore_apps_list.append(app_name)
-            appstore_count += 1
-        else:
-            manual_apps_list.append(app_name)
-            manual_app_paths[app_name] = app
-            manual_count += 1
-
-    # Sort all lists alphabetically
-    brew_apps_list.sort()
-    appstore_apps_list.sort()
-    manual_apps_list.sort()
-
-    return (brew_apps_list, appstore_apps_list, manual_apps_list, manual_app_paths,
-            brew_count, appstore_count, manual_count)
\ No newline at end of file
+        homebrew_apps=tuple(homebrew_apps),
+        appstore_apps=tuple(appstore_apps),
+        manual_apps=tuple(manual_apps),
+        manual_app_paths=manual_app_paths
+    )
\ No newline at end of file
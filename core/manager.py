@@ -1,12 +1,96 @@
 """Application lifecycle management functionality."""
 
+import os
 import subprocess
 import time
 import shlex
 
 
-def is_app_running(app_name):
-    """Check if an application is currently running"""
+def get_running_app_names():
+    """Get the names of all running applications from a single process listing
+
+    Both the enclosing .app bundle name and the executable name of every process
+    are included, so the result can be matched against app names without ".app".
+
+    Returns:
+        Set of running app names, or None if the process list could not be read
+    """
+    try:
+        result = subprocess.run(['ps', '-Ao', 'comm='], capture_output=True, text=True)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    running = set()
+    for command in result.stdout.splitlines():
+        command = command.strip()
+        if not command:
+            continue
+        # e.g. /Applications/Foo.app/Contents/MacOS/foo -> "Foo" and "foo"
+        bundle_path, separator, _ = command.partition(".app/Contents/")
+        if separator:
+            running.add(os.path.basename(bundle_path))
+        running.add(os.path.basename(command))
+    return running
+
+
+def _run_run_loop(seconds):
+    """Let the current run loop process pending events for a while
+
+    NSWorkspace and NSRunningApplication only update their state when a run
+    loop turns, and a command line tool has none running on its own.
+    """
+    from Foundation import NSDate, NSRunLoop
+    NSRunLoop.currentRunLoop().runUntilDate_(NSDate.dateWithTimeIntervalSinceNow_(seconds))
+
+
+def _find_running_applications(app_name):
+    """Find the running instances of an application in-process with NSWorkspace
+
+    An instance matches if its bundle is named "<app_name>.app" or its
+    localized name is app_name.
+
+    Returns:
+        List of NSRunningApplication objects, or None if PyObjC is not available
+    """
+    try:
+        from AppKit import NSWorkspace
+    except ImportError:
+        return None
+
+    # Pick up launches and exits since the list was last read
+    _run_run_loop(0.05)
+
+    clean_app_name = app_name.replace(".app", "")
+    bundle_name = f"{clean_app_name}.app"
+
+    matches = []
+    for app in NSWorkspace.sharedWorkspace().runningApplications():
+        bundle_url = app.bundleURL()
+        if (bundle_url is not None and bundle_url.lastPathComponent() == bundle_name) \
+                or app.localizedName() == clean_app_name:
+            matches.append(app)
+    return matches
+
+
+def is_app_running(app_name, running_apps=None):
+    """Check if an application is currently running
+
+    Args:
+        app_name: Name of the app
+        running_apps: Optional snapshot from get_running_app_names() to check
+            against instead of querying for this app
+    """
+    if running_apps is not None:
+        return app_name.replace(".app", "") in running_apps
+
+    # In-process check when PyObjC is available, no osascript needed
+    running = _find_running_applications(app_name)
+    if running is not None:
+        return bool(running)
+
     try:
         # Use Apple's System Events to check if app is running
         # Security fix: Use shlex.quote to prevent shell injection
@@ -16,18 +100,64 @@ def is_app_running(app_name):
             'osascript',
             '-e',
             script
-        ], capture_output=True, text=True)
+        ], capture_output=True)
 
-        # Parse the output - if greater than 0, app is running
-        count = int(result.stdout.strip())
+        # Parse the output - if greater than 0, app is running. The reply is a
+        # plain number, so it is parsed from bytes without decoding it first
+        count = int(result.stdout.strip() or b'0')
         return count > 0
     except (ValueError, subprocess.SubprocessError):
         # If there's an error, assume app is not running
         return False
 
 
+def _still_running(app_name, running):
+    """Return the instances of an app that haven't exited yet
+
+    A fresh process listing answers this. isTerminated() is only updated
+    while a run loop turns, so it is only relied on when ps can't be run.
+    """
+    running_apps = get_running_app_names()
+    if running_apps is not None:
+        return running if is_app_running(app_name, running_apps) else []
+
+    _run_run_loop(0.1)
+    return [app for app in running if not app.isTerminated()]
+
+
+def _terminate_running_applications(app_name, running):
+    """Quit the given NSRunningApplication instances, force quitting any that don't exit
+
+    Returns:
+        True if every instance has exited
+    """
+    for app in running:
+        app.terminate()
+
+    # Wait a moment for the app to quit
+    time.sleep(1)
+
+    remaining = _still_running(app_name, running)
+    if remaining:
+        for app in remaining:
+            app.forceTerminate()
+        # Wait again to ensure it's terminated
+        time.sleep(1)
+        remaining = _still_running(app_name, remaining)
+
+    return not remaining
+
+
 def kill_app(app_name):
     """Attempt to quit an application gracefully"""
+    # Quit through NSRunningApplication when PyObjC is available
+    running = _find_running_applications(app_name)
+    if running is not None:
+        try:
+            return _terminate_running_applications(app_name, running)
+        except Exception:
+            return False
+
     try:
         # First try to quit the app gracefully
         # Security fix: Use shlex.quote to prevent shell injection
@@ -42,8 +172,9 @@ def kill_app(app_name):
         # Wait a moment for the app to quit
         time.sleep(1)
 
-        # Check if the app is still running
-        if is_app_running(app_name):
+        # Check if the app is still running (a process listing is much cheaper
+        # than asking System Events)
+        if is_app_running(app_name, get_running_app_names()):
             # If still running, force quit
             # Security fix: Use shlex.quote to prevent shell injection
             clean_app_name = app_name.replace(".app", "")
@@ -56,13 +187,33 @@ def kill_app(app_name):
             # Wait again to ensure it's terminated
             time.sleep(1)
 
-        return not is_app_running(app_name)
+        return not is_app_running(app_name, get_running_app_names())
     except subprocess.SubprocessError:
         return False
 
 
+def _trash_with_file_manager(app_path):
+    """Move a path to the Trash in-process with NSFileManager
+
+    Returns:
+        True if the path was trashed, False if it wasn't, or None if PyObjC
+        is not available
+    """
+    try:
+        from Foundation import NSFileManager, NSURL
+    except ImportError:
+        return None
+
+    try:
+        url = NSURL.fileURLWithPath_(app_path)
+        success, _, _ = NSFileManager.defaultManager().trashItemAtURL_resultingItemURL_error_(url, None, None)
+        return bool(success)
+    except Exception:
+        return False
+
+
 def move_to_trash(app_path):
-    """Move an application to trash using Finder"""
+    """Move an application to trash, via NSFileManager when PyObjC is installed, otherwise Finder"""
     try:
         # Security fix: Validate input to prevent shell injection
         if not app_path or not isinstance(app_path, str):
@@ -72,6 +223,12 @@ def move_to_trash(app_path):
         if not app_path.startswith('/') or '..' in app_path:
             return False
 
+        # No subprocess or AppleScript round trip when PyObjC is available. If it
+        # fails (e.g. the app needs admin rights to remove) Finder gets a try, as
+        # it can ask for authentication
+        if _trash_with_file_manager(app_path):
+            return True
+
         # Escape any double quotes in the path itself, then wrap in double quotes for AppleScript
         escaped_path = app_path.replace('"', '\\"')
         script = f'tell application "Finder" to move POSIX file "{escaped_path}" to trash'
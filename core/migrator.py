@@ -1,10 +1,122 @@
 """Application migration orchestration."""
 
+import os
+import queue
+import re
+import selectors
 import subprocess
 import shlex
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from utils.ui import Colors, StatusIcons, SectionDivider, MigrationTable, ProgressIndicator, StatusLine
-from .manager import is_app_running, kill_app, move_to_trash
+from providers.brew_cache import get_brew_cache
+from providers.homebrew import check_brew_equivalent
+from providers.homebrew_api import get_api
+from .manager import is_app_running, get_running_app_names, kill_app, move_to_trash
+
+# Upper bound on concurrent Homebrew lookups (each may spawn mdls/brew/osascript),
+# also used by the migrate command
+MAX_LOOKUP_WORKERS = min(16, (os.cpu_count() or 4) * 4)
+
+# Longest a single background cask download may take before it is abandoned
+PREFETCH_TIMEOUT = 1800
+
+# Minimum seconds between table redraws while brew install output streams in
+RENDER_INTERVAL = 0.1
+
+# Minimum seconds between progress line updates while apps are checked
+PROGRESS_INTERVAL = 0.05
+
+# Lines taken by the migration mode menu once answered: 1 empty line, 4 menu
+# lines, 1 empty line before input, 1 input line
+MENU_LINES = 7
+
+# Classifies a line of `brew install` output by the step it reports. Each
+# alternative looks ahead through the whole line from its start, so when a line
+# mentions several steps the earliest alternative wins and lastgroup names it.
+# Output is read as bytes, so lines are never decoded
+_BREW_STEP_RE = re.compile(
+    rb'^(?:(?=.*?(?P<download>Downloading))'
+    rb'|(?=.*?(?P<verify>Verifying|(?i:checksum)))'
+    rb'|(?=.*?(?P<extract>(?i:extract)))'
+    rb'|(?=.*?(?P<install>Installing))'
+    rb'|(?=.*?(?P<move>Moving))'
+    rb'|(?=.*?(?P<link>Linking)))'
+)
+_PERCENT_RE = re.compile(rb'(\d+)%')
+
+
+class _CaskPrefetcher:
+    """Download casks in the background ahead of their installation
+
+    Casks are fetched one at a time, in order, with `brew fetch --cask`, so the
+    download for the next app overlaps with removing and installing the current
+    one; `brew install` then finds the download in Homebrew's cache.
+    """
+
+    def __init__(self, cask_names):
+        """Start fetching cask_names in a background thread
+
+        Args:
+            cask_names: Cask tokens in the order they will be installed
+        """
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._fetches = {}  # cask -> Event set when its fetch has finished
+        self._skipped = set()
+        self._stopped = False
+
+        for cask_name in cask_names:
+            self._queue.put(cask_name)
+        self._queue.put(None)  # No more casks
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Fetch queued casks until the queue is exhausted or stop() is called"""
+        # Keep brew from auto-updating, which would contend with the installs
+        env = dict(os.environ, HOMEBREW_NO_AUTO_UPDATE='1')
+
+        while True:
+            cask_name = self._queue.get()
+            if cask_name is None:
+                return
+
+            with self._lock:
+                if self._stopped:
+                    return
+                if cask_name in self._skipped:
+                    continue
+                finished = self._fetches[cask_name] = threading.Event()
+
+            try:
+                subprocess.run(['brew', 'fetch', '--cask', cask_name],
+                               capture_output=True, env=env, timeout=PREFETCH_TIMEOUT)
+            except (OSError, subprocess.SubprocessError):
+                pass  # brew install will download it itself
+            finally:
+                finished.set()
+
+    def wait_for(self, cask_name):
+        """Make sure no background fetch of cask_name is running before it is installed
+
+        A fetch that is underway is waited for (brew would refuse to install
+        while the download is locked); one that hasn't started is skipped.
+        """
+        with self._lock:
+            finished = self._fetches.get(cask_name)
+            if finished is None:
+                self._skipped.add(cask_name)
+                return
+        finished.wait()
+
+    def stop(self):
+        """Stop fetching once the current download, if any, has finished"""
+        with self._lock:
+            self._stopped = True
 
 
 def _perform_migration(app_name, app_path, cask_name, migration_table=None, status_line=None):
@@ -22,8 +134,7 @@ def _perform_migration(app_name, app_path, cask_name, migration_table=None, stat
         actual_cask_name = cask_name.split(' [')[0] if ' [' in cask_name else cask_name
 
         # Check if the cask is deprecated before proceeding
-        from providers.homebrew_api import HomebrewAPI
-        api = HomebrewAPI()
+        api = get_api()
         is_deprecated, deprecation_msg = api.is_cask_deprecated(actual_cask_name)
 
         if is_deprecated:
@@ -42,6 +153,18 @@ def _perform_migration(app_name, app_path, cask_name, migration_table=None, stat
                     migration_table.update_status(app_name, "Skipped (deprecated)")
                     migration_table.render_progress()
                 return False
+
+        # Nothing to install if the cask is already there. The app is kept too,
+        # since `brew install` wouldn't bring it back after trashing it
+        brew_cache = get_brew_cache()
+        if brew_cache.is_cask_installed(actual_cask_name):
+            if migration_table:
+                migration_table.update_status(app_name, f"{StatusIcons.SUCCESS} Done")
+                migration_table.render_progress()
+            if status_line:
+                status_line.update("Already installed", f"{actual_cask_name} via Homebrew", "success")
+            return True
+
         # Step 1: Move the application to trash
         if migration_table:
             migration_table.update_status(app_name, "Removing")
@@ -70,44 +193,79 @@ def _perform_migration(app_name, app_path, cask_name, migration_table=None, stat
 
         process = subprocess.Popen(['brew', 'install', '--cask', actual_cask_name],
                                   stdout=subprocess.PIPE,
-                                  stderr=subprocess.STDOUT,
-                                  universal_newlines=True)
+                                  stderr=subprocess.STDOUT)
+
+        # Status line update for each step other than downloading
+        step_status = {
+            'verify': lambda: status_line.update("Verifying", "Package signature"),
+            'extract': lambda: status_line.update("Extracting", f"{actual_cask_name}.app"),
+            'install': lambda: status_line.update("Installing", f"/Applications/{app_name}"),
+            'move': lambda: status_line.update("Installing", f"Moving to /Applications"),
+            'link': lambda: status_line.update("Linking", "Creating symlinks"),
+        }
 
-        output_lines = []
         progress_pct = 0
-        for line in process.stdout:
-            output_lines.append(line.strip())
+        rendered_pct = None
+        last_render = 0.0
+
+        def show_progress(force=False):
+            # Redraw the app's status cell when the percentage has changed, at
+            # most every RENDER_INTERVAL seconds unless forced
+            nonlocal rendered_pct, last_render
+            if not migration_table or progress_pct == rendered_pct:
+                return
+            now = time.monotonic()
+            if force or now - last_render >= RENDER_INTERVAL:
+                migration_table.update_status_live(app_name, f"{StatusIcons.PROCESSING} {progress_pct}%")
+                rendered_pct = progress_pct
+                last_render = now
+
+        def handle_line(line):
+            nonlocal progress_pct
+            match = _BREW_STEP_RE.match(line)
+            step = match.lastgroup if match else None
 
             # Update status line with detailed progress
-            if status_line:
-                if "Downloading" in line:
+            if status_line and step:
+                if step == 'download':
                     # Try to extract download progress if available
-                    if "%" in line:
-                        import re
-                        pct_match = re.search(r'(\d+)%', line)
+                    if b"%" in line:
+                        pct_match = _PERCENT_RE.search(line)
                         if pct_match:
-                            status_line.update("Downloading", f"{actual_cask_name} {pct_match.group(1)}%")
+                            status_line.update("Downloading", f"{actual_cask_name} {pct_match.group(1).decode()}%")
                     else:
                         status_line.update("Downloading", actual_cask_name)
-                elif "Verifying" in line or "checksum" in line.lower():
-                    status_line.update("Verifying", "Package signature")
-                elif "Extracting" in line or "extract" in line.lower():
-                    status_line.update("Extracting", f"{actual_cask_name}.app")
-                elif "Installing" in line:
-                    status_line.update("Installing", f"/Applications/{app_name}")
-                elif "Moving" in line:
-                    status_line.update("Installing", f"Moving to /Applications")
-                elif "Linking" in line:
-                    status_line.update("Linking", "Creating symlinks")
+                else:
+                    step_status[step]()
 
             # Update progress in table
-            if migration_table:
-                if "Downloading" in line:
-                    progress_pct = min(progress_pct + 10, 50)
-                elif "Installing" in line:
-                    progress_pct = min(progress_pct + 25, 90)
-                migration_table.update_status(app_name, f"{StatusIcons.PROCESSING} {progress_pct}%")
-                migration_table.render_progress()
+            if step == 'download':
+                progress_pct = min(progress_pct + 10, 50)
+            elif step == 'install':
+                progress_pct = min(progress_pct + 25, 90)
+            show_progress()
+
+        # Output is waited for with a timeout, so a redraw skipped by the
+        # throttle is still shown while brew is quiet (e.g. during a download)
+        stdout_fd = process.stdout.fileno()
+        partial_line = b''
+        with selectors.DefaultSelector() as selector:
+            selector.register(stdout_fd, selectors.EVENT_READ)
+            while True:
+                if not selector.select(timeout=RENDER_INTERVAL):
+                    show_progress()
+                    continue
+                chunk = os.read(stdout_fd, 65536)
+                if not chunk:
+                    break
+                *lines, partial_line = (partial_line + chunk).split(b'\n')
+                for line in lines:
+                    handle_line(line)
+        if partial_line:
+            handle_line(partial_line)
+
+        # Show the last percentage if its redraw was skipped
+        show_progress(force=True)
 
         return_code = process.wait()
 
@@ -117,6 +275,9 @@ def _perform_migration(app_name, app_path, cask_name, migration_table=None, stat
                 migration_table.render_progress()
             return False
 
+        # Later migrations to the same cask see it as installed without another `brew list`
+        brew_cache.mark_cask_installed(actual_cask_name)
+
         if migration_table:
             migration_table.update_status(app_name, f"{StatusIcons.SUCCESS} Done")
             migration_table.render_progress()
@@ -133,42 +294,92 @@ def _perform_migration(app_name, app_path, cask_name, migration_table=None, stat
         return False
 
 
-def select_migration_mode(manual_apps_list, manual_app_paths, apps_without_matches=None):
-    """Present migration modes to the user and return the selected apps for migration
+def _lookup_casks(app_name, app_path, app_casks=None):
+    """Get Homebrew casks for an app, reusing already resolved matches when available
 
     Args:
-        manual_apps_list: List of app names with Homebrew matches
-        manual_app_paths: Dict mapping app names to paths
-        apps_without_matches: List of app names without Homebrew matches
+        app_name: Name of the app
+        app_path: Path to the app
+        app_casks: Optional dict mapping app names to previously resolved casks
 
     Returns:
-        Tuple of (selected_apps, auto_approve, migration_table)
+        List of (cask_name, description) tuples
     """
-    from providers.homebrew import check_brew_equivalent
-    import sys
+    if app_casks is not None and app_name in app_casks:
+        return app_casks[app_name]
 
-    print(f"\n{Colors.ORANGE}[MIGRATION]{Colors.RESET} Checking apps for Homebrew packages")
+    return check_brew_equivalent(app_name, app_path)
 
-    # Build list of apps with their targets - progressively
-    apps_with_targets = []
-    sorted_apps = sorted(manual_apps_list)
-    total_apps = len(sorted_apps)
 
-    for i, app_name in enumerate(sorted_apps):
-        # Show progress message
-        progress_msg = f"Checking {i+1}/{total_apps}: {app_name[:40]}..."
-        sys.stdout.write(f"\r{Colors.DIM}{progress_msg}{Colors.RESET}")
+def _resolve_cask_targets(app_names, app_paths, app_casks=None):
+    """Find the Homebrew cask to migrate each app to, showing progress as apps are checked
+
+    Apps without an already resolved match are looked up concurrently.
+
+    Args:
+        app_names: List of app names
+        app_paths: Dict mapping app names to paths
+        app_casks: Optional dict mapping app names to already resolved casks;
+            casks looked up here are added to it for later reuse
+
+    Returns:
+        List of (app_name, cask_name) tuples sorted by app name, for apps with a
+        match; cask_name carries any deprecation notice
+    """
+    sorted_apps = sorted(app_names)
+    total_apps = len(sorted_apps)
+    resolved = {}
+    progress_prefix = f"\r{Colors.DIM}Checking "
+    progress_suffix = f"...{Colors.RESET}"
+    last_progress = 0.0
+
+    def show_progress(app_name):
+        # Show progress message, at most every PROGRESS_INTERVAL seconds
+        # except for the last app
+        nonlocal last_progress
+        now = time.monotonic()
+        if now - last_progress < PROGRESS_INTERVAL and len(resolved) < total_apps:
+            return
+        last_progress = now
+        sys.stdout.write(f"{progress_prefix}{len(resolved)}/{total_apps}: {app_name[:40]}{progress_suffix}")
         sys.stdout.flush()
 
-        app_path = manual_app_paths.get(app_name)
-        casks = check_brew_equivalent(app_name, app_path)
+    to_lookup = []
+    for app_name in sorted_apps:
+        if app_casks is not None and app_name in app_casks:
+            resolved[app_name] = app_casks[app_name]
+            show_progress(app_name)
+        else:
+            to_lookup.append(app_name)
+
+    if to_lookup:
+        with ThreadPoolExecutor(max_workers=min(MAX_LOOKUP_WORKERS, len(to_lookup))) as executor:
+            futures = {
+                executor.submit(_lookup_casks, app_name, app_paths.get(app_name)): app_name
+                for app_name in to_lookup
+            }
+            # Progress is only written from this thread, as lookups complete
+            for future in as_completed(futures):
+                app_name = futures[future]
+                try:
+                    resolved[app_name] = future.result()
+                except Exception:
+                    resolved[app_name] = []
+                show_progress(app_name)
+
+        if app_casks is not None:
+            for app_name in to_lookup:
+                app_casks[app_name] = resolved[app_name]
+
+    apps_with_targets = []
+    for app_name in sorted_apps:
+        casks = resolved[app_name]
         if casks:
             cask_name = casks[0][0]  # Use first match
             cask_desc = casks[0][1] if len(casks[0]) > 1 else ""
             # Check if deprecation info is in the description
             if "[DEPRECATED" in cask_desc or "[DISABLED" in cask_desc:
                 # Extract the deprecation info from description and add to cask name
-                import re
                 deprecation_match = re.search(r'\[(DEPRECATED|DISABLED)[^\]]*\]', cask_desc)
                 if deprecation_match:
                     deprecation_info = deprecation_match.group(0)
@@ -179,6 +390,34 @@ def select_migration_mode(manual_apps_list, manual_app_paths, apps_without_match
     sys.stdout.write("\r" + " " * 80 + "\r")
     sys.stdout.flush()
 
+    return apps_with_targets
+
+
+def _clear_lines(count):
+    """Erase the last count lines of output, leaving the cursor where the first of them began"""
+    # Cursor up count lines, then clear to the end of the screen, in one write
+    sys.stdout.write(f"\r\033[{count}A\033[J")
+    sys.stdout.flush()
+
+
+def select_migration_mode(manual_apps_list, manual_app_paths, apps_without_matches=None, app_casks=None):
+    """Present migration modes to the user and return the selected apps for migration
+
+    Args:
+        manual_apps_list: List of app names with Homebrew matches
+        manual_app_paths: Dict mapping app names to paths
+        apps_without_matches: List of app names without Homebrew matches
+        app_casks: Optional dict mapping app names to already resolved casks;
+            casks looked up here are added to it
+
+    Returns:
+        Tuple of (selected_apps, auto_approve, migration_table)
+    """
+    print(f"\n{Colors.ORANGE}[MIGRATION]{Colors.RESET} Checking apps for Homebrew packages")
+
+    # Build list of apps with their targets
+    apps_with_targets = _resolve_cask_targets(manual_apps_list, manual_app_paths, app_casks)
+
     # Create migration table
     migration_table = MigrationTable(apps_with_targets, apps_without_matches)
 
@@ -201,11 +440,7 @@ def select_migration_mode(manual_apps_list, manual_app_paths, apps_without_match
 
         if choice == "3":
             # Migrate all apps
-            # Clear the menu options and input line (7 lines total)
-            # 1 empty line, 4 menu lines, 1 empty line before input, 1 input line
-            for _ in range(7):
-                sys.stdout.write("\033[A\033[2K")  # Move up and clear line
-            sys.stdout.flush()
+            _clear_lines(MENU_LINES)
 
             # Select all apps (update_display=True will handle the rendering)
             all_indices = list(range(1, len(apps_with_targets) + 1))
@@ -221,11 +456,7 @@ def select_migration_mode(manual_apps_list, manual_app_paths, apps_without_match
 
         elif choice == "2":
             # Select specific apps
-            # Clear the menu options and input line (7 lines total)
-            # 1 empty line, 4 menu lines, 1 empty line before input, 1 input line
-            for _ in range(7):
-                sys.stdout.write("\033[A\033[2K")  # Move up and clear line
-            sys.stdout.flush()
+            _clear_lines(MENU_LINES)
 
             selections = input(f"Select apps [1-{len(apps_with_targets)}, all, none]: ").strip()
 
@@ -267,11 +498,7 @@ def select_migration_mode(manual_apps_list, manual_app_paths, apps_without_match
 
         elif choice == "1":
             # Manual approval for each app
-            # Clear the menu options and input line (7 lines total)
-            # 1 empty line, 4 menu lines, 1 empty line before input, 1 input line
-            for _ in range(7):
-                sys.stdout.write("\033[A\033[2K")  # Move up and clear line
-            sys.stdout.flush()
+            _clear_lines(MENU_LINES)
 
             print(f"Selected: Approve each app manually")
             return [app for app, _ in apps_with_targets], False, migration_table
@@ -280,7 +507,78 @@ def select_migration_mode(manual_apps_list, manual_app_paths, apps_without_match
             print(f"{Colors.YELLOW}Invalid choice. Please enter 1, 2, or 3.{Colors.RESET}")
 
 
-def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve=False, apps_without_matches=None):
+def _migrate_concurrently(app_names, app_paths, app_casks, migration_table, status_line, running_apps,
+                          max_workers):
+    """Migrate apps in auto-approve mode, running up to max_workers migrations at once
+
+    Apps are prepared one at a time in this thread first (finding their cask and
+    quitting them if they are running), then migrated in worker threads. The
+    migrations only report progress in the table, not the status line.
+
+    Args:
+        app_names: List of app names to migrate
+        app_paths: Dict mapping app names to paths
+        app_casks: Optional dict mapping app names to already resolved casks
+        migration_table: MigrationTable for status updates
+        status_line: StatusLine for progress while apps are prepared
+        running_apps: Snapshot from get_running_app_names()
+        max_workers: Maximum number of concurrent migrations
+
+    Returns:
+        Tuple of (migrated_count, failed_apps, deferred_apps). deferred_apps
+        are the apps whose cask is deprecated or disabled; those migrations ask
+        for confirmation, so they are left to the caller to run one at a time
+    """
+    api = get_api()
+
+    failed_apps = []
+    deferred_apps = []
+    to_migrate = []
+    for app_name in app_names:
+        app_path = app_paths[app_name]
+        casks = _lookup_casks(app_name, app_path, app_casks)
+        if not casks:
+            migration_table.update_status(app_name, f"{StatusIcons.WARNING} No match")
+            migration_table.render_progress()
+            continue
+
+        # Use first match, as auto-approve mode does when there are several
+        cask_name = casks[0][0]
+        if api.is_cask_deprecated(cask_name.split(' [')[0])[0]:
+            deferred_apps.append(app_name)
+            continue
+
+        if is_app_running(app_name, running_apps):
+            status_line.update("Stopping", app_name)
+            if not kill_app(app_name):
+                status_line.update("Failed", f"Could not stop {app_name}", "error")
+                migration_table.update_status(app_name, f"{StatusIcons.FAILED} Failed")
+                migration_table.render_progress()
+                failed_apps.append(app_name)
+                continue
+
+        to_migrate.append((app_name, app_path, cask_name))
+
+    status_line.clear()
+
+    migrated_count = 0
+    if to_migrate:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(to_migrate))) as executor:
+            futures = {
+                executor.submit(_perform_migration, app_name, app_path, cask_name, migration_table): app_name
+                for app_name, app_path, cask_name in to_migrate
+            }
+            for future in as_completed(futures):
+                if future.result():
+                    migrated_count += 1
+                else:
+                    failed_apps.append(futures[future])
+
+    return migrated_count, failed_apps, deferred_apps
+
+
+def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve=False, apps_without_matches=None,
+                                app_casks=None, max_parallel=1):
     """Improved migration routine with different approval modes
 
     Args:
@@ -288,48 +586,30 @@ def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve
         manual_app_paths: Dict mapping app names to paths
         auto_approve: Whether to skip individual confirmations
         apps_without_matches: List of app names without Homebrew matches
+        app_casks: Optional dict mapping app names to already resolved casks,
+            avoiding a second lookup per app
+        max_parallel: Number of migrations to run at once in auto-approve mode
     """
 
     if not manual_apps_list:
         print(f"{Colors.YELLOW}No manually installed applications found to migrate.{Colors.RESET}")
         return 0
 
+    # Casks looked up while building the table are kept here, so the migration
+    # loop below doesn't look any app up twice
+    if app_casks is None:
+        app_casks = {}
+
+    # Each migration checks whether its cask is already installed; list the
+    # installed casks in the background while apps are checked and selected
+    threading.Thread(target=get_brew_cache().get_installed_casks, daemon=True).start()
+
     # Get user's preferred migration mode (unless auto_approve is already set)
     if auto_approve:
-        from providers.homebrew import check_brew_equivalent
-        import sys
-
         print(f"\n{Colors.ORANGE}[MIGRATION]{Colors.RESET} Checking apps for Homebrew packages")
 
-        # Build list for auto mode - progressively
-        apps_with_targets = []
-        sorted_apps = sorted(manual_apps_list)
-        total_apps = len(sorted_apps)
-
-        for i, app_name in enumerate(sorted_apps):
-            # Show progress message
-            progress_msg = f"Checking {i+1}/{total_apps}: {app_name[:40]}..."
-            sys.stdout.write(f"\r{Colors.DIM}{progress_msg}{Colors.RESET}")
-            sys.stdout.flush()
-
-            app_path = manual_app_paths.get(app_name)
-            casks = check_brew_equivalent(app_name, app_path)
-            if casks:
-                cask_name = casks[0][0]  # Use first match
-                cask_desc = casks[0][1] if len(casks[0]) > 1 else ""
-                # Check if deprecation info is in the description
-                if "[DEPRECATED" in cask_desc or "[DISABLED" in cask_desc:
-                    # Extract the deprecation info from description and add to cask name
-                    import re
-                    deprecation_match = re.search(r'\[(DEPRECATED|DISABLED)[^\]]*\]', cask_desc)
-                    if deprecation_match:
-                        deprecation_info = deprecation_match.group(0)
-                        cask_name = f"{cask_name} {deprecation_info}"
-                apps_with_targets.append((app_name, cask_name))
-
-        # Clear the progress line
-        sys.stdout.write("\r" + " " * 80 + "\r")
-        sys.stdout.flush()
+        # Build list for auto mode
+        apps_with_targets = _resolve_cask_targets(manual_apps_list, manual_app_paths, app_casks)
 
         migration_table = MigrationTable(apps_with_targets, apps_without_matches)
         # Select all for auto mode
@@ -338,7 +618,7 @@ def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve
         print(f"Auto-approval mode: Migrating all {len(manual_apps_list)} apps")
     else:
         selected_apps, auto_approve, migration_table = select_migration_mode(
-            manual_apps_list, manual_app_paths, apps_without_matches
+            manual_apps_list, manual_app_paths, apps_without_matches, app_casks
         )
 
     if not selected_apps or migration_table is None:
@@ -350,12 +630,44 @@ def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve
     # Create status line for detailed progress
     status_line = StatusLine()
 
+    # One process listing answers the running check for every selected app
+    running_apps = get_running_app_names()
+
+    parallel = auto_approve and max_parallel > 1
+
+    # In auto-approve mode every selected app will be installed with its first
+    # match, so those downloads can start ahead of time. Parallel migrations
+    # already overlap their downloads
+    prefetcher = None
+    if auto_approve and app_casks and not parallel:
+        # Installed casks are skipped by _perform_migration and deprecated ones
+        # may be refused, so don't download those
+        api = get_api()
+        brew_cache = get_brew_cache()
+        prefetch_casks = []
+        for app_name in selected_apps:
+            if not app_casks.get(app_name):
+                continue
+            cask_name = app_casks[app_name][0][0].split(' [')[0]
+            if brew_cache.is_cask_installed(cask_name) or api.is_cask_deprecated(cask_name)[0]:
+                continue
+            prefetch_casks.append(cask_name)
+        prefetcher = _CaskPrefetcher(prefetch_casks)
+
     # Set all selected apps to Queue status initially
     for app_name in selected_apps:
         migration_table.update_status(app_name, f"{StatusIcons.WARNING}⏸ Queue")
     migration_table.render_progress()
 
-    for app_name in selected_apps:
+    # Apps migrated one at a time below. In parallel mode only those that need
+    # confirmation are left for it
+    sequential_apps = selected_apps
+    if parallel:
+        migrated_count, failed_apps, sequential_apps = _migrate_concurrently(
+            selected_apps, manual_app_paths, app_casks, migration_table, status_line, running_apps, max_parallel
+        )
+
+    for app_name in sequential_apps:
         app_path = manual_app_paths[app_name]
 
         # Update status to processing
@@ -363,8 +675,7 @@ def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve
         migration_table.render_progress()
 
         # Get available brew casks for this app
-        from providers.homebrew import check_brew_equivalent
-        casks = check_brew_equivalent(app_name, app_path)
+        casks = _lookup_casks(app_name, app_path, app_casks)
 
         if not casks:
             migration_table.update_status(app_name, f"{StatusIcons.WARNING} No match")
@@ -373,7 +684,7 @@ def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve
 
         # Check if the app is currently running
         status_line.update("Checking", f"{app_name} running state")
-        app_running = is_app_running(app_name)
+        app_running = is_app_running(app_name, running_apps)
 
         if app_running:
             status_line.clear()
@@ -418,6 +729,9 @@ def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve
                     status_line.clear()  # Clear after skipping
                     continue
 
+            if prefetcher:
+                prefetcher.wait_for(cask_name.split(' [')[0])
+
             # Perform migration with table updates and status line
             if _perform_migration(app_name, app_path, cask_name, migration_table, status_line):
                 migrated_count += 1
@@ -435,6 +749,8 @@ def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve
             if auto_approve:
                 selected_cask = casks[0][0]
                 print(f"Auto-selecting: {selected_cask}")
+                if prefetcher:
+                    prefetcher.wait_for(selected_cask.split(' [')[0])
                 if _perform_migration(app_name, app_path, selected_cask, migration_table, status_line):
                     migrated_count += 1
             else:
@@ -460,6 +776,9 @@ def migrate_manual_apps_to_brew(manual_apps_list, manual_app_paths, auto_approve
                     except ValueError:
                         print(f"{Colors.YELLOW}Invalid input. Please enter a number or 'c'.{Colors.RESET}")
 
+    if prefetcher:
+        prefetcher.stop()
+
     # Clear status line before final summary
     status_line.clear()
 
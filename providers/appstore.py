@@ -1,31 +1,119 @@
 """Mac App Store operations."""
 
+import functools
+import re
+import shutil
 import subprocess
+import threading
+import time
 import logging
+from typing import Dict, Optional, Set, Tuple
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
+# A `mas list` line: "<id>  <name>  (<version>)"
+_MAS_LIST_LINE_RE = re.compile(r'^\s*(\d+)\s+(.+?)(?:\s+\([^)]*\))?\s*$')
 
+
+class MasCache:
+    """Singleton cache for `mas search` results with TTL (time-to-live).
+
+    Like BrewCache, a single thread-safe instance is shared by the whole
+    application, so each app name is searched for at most once per TTL.
+    Results are keyed by lowercased app name without ".app".
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        """Implement singleton pattern with thread safety."""
+        if cls._instance is None:
+            with cls._lock:
+                # Double-check locking pattern
+                if cls._instance is None:
+                    cls._instance = super(MasCache, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Initialize the cache if not already initialized."""
+        # Only initialize once
+        if hasattr(self, '_initialized'):
+            return
+
+        self._initialized = True
+        self._cache_lock = threading.Lock()
+        self._ttl = 300  # 5 minutes TTL, as for BrewCache
+
+        # key -> (found in App Store, timestamp)
+        self._search_results: Dict[str, Tuple[bool, float]] = {}
+
+    def get(self, key: str) -> Optional[bool]:
+        """Get a cached search result.
+
+        Args:
+            key: Lowercased app name without ".app"
+
+        Returns:
+            The cached result, or None if there is none or it has expired
+        """
+        with self._cache_lock:
+            entry = self._search_results.get(key)
+        if entry is None or time.time() - entry[1] >= self._ttl:
+            return None
+        return entry[0]
+
+    def set(self, key: str, found: bool):
+        """Cache a search result.
+
+        Args:
+            key: Lowercased app name without ".app"
+            found: Whether the app was found in the App Store
+        """
+        with self._cache_lock:
+            self._search_results[key] = (found, time.time())
+
+    def clear(self):
+        """Drop all cached search results."""
+        with self._cache_lock:
+            self._search_results.clear()
+
+
+def get_mas_cache() -> MasCache:
+    """Get the MasCache singleton instance.
+
+    Returns:
+        The singleton MasCache instance
+    """
+    return MasCache()
+
+
+@functools.lru_cache(maxsize=None)
 def check_mas_installed():
-    """Check if mas (Mac App Store CLI) is installed with improved error reporting"""
-    try:
-        result = subprocess.run(["which", "mas"], check=True, capture_output=True, text=True)
-        logger.debug(f"mas CLI found at: {result.stdout.strip()}")
+    """Check if mas (Mac App Store CLI) is installed
+
+    PATH is searched in-process, once; the answer is reused until
+    invalidate_mas_cache() is called.
+    """
+    mas_path = shutil.which("mas")
+    if mas_path:
+        logger.debug(f"mas CLI found at: {mas_path}")
         return True
-    except subprocess.CalledProcessError:
-        logger.info("mas CLI is not installed or not in PATH")
-        return False
-    except FileNotFoundError:
-        logger.error("'which' command not found - unable to check for mas CLI")
-        return False
-    except Exception as e:
-        logger.error(f"Unexpected error checking for mas CLI: {e}")
-        return False
+    logger.info("mas CLI is not installed or not in PATH")
+    return False
+
+
+def invalidate_mas_cache():
+    """Forget whether mas is installed, so the next check searches PATH again"""
+    check_mas_installed.cache_clear()
 
 
 def is_mas_app_by_search(app_name):
-    """Check if an app is available in Mac App Store using mas search with improved error handling"""
+    """Check if an app is available in Mac App Store using mas search with improved error handling
+
+    Results are cached in MasCache, so each app is only searched for once.
+    """
     if not check_mas_installed():
         logger.debug("mas CLI not available for App Store search")
         return False
@@ -42,6 +130,27 @@ def is_mas_app_by_search(app_name):
         logger.warning(f"App name too long or empty after cleaning: '{clean_name}'")
         return False
 
+    cache = get_mas_cache()
+    key = clean_name.lower()
+    found = cache.get(key)
+    if found is not None:
+        return found
+
+    found = _search_mas(clean_name)
+    if found is None:
+        # Not cached, so a failed search is retried next time
+        return False
+    cache.set(key, found)
+    return found
+
+
+def _search_mas(clean_name):
+    """Run `mas search` for an app
+
+    Returns:
+        True if an App Store result contains the name, False if none does, or
+        None if the search failed
+    """
     try:
         # Security fix: Using array form which is already safe, but added validation
         result = subprocess.run(["mas", "search", clean_name],
@@ -49,13 +158,13 @@ def is_mas_app_by_search(app_name):
 
         if result.returncode != 0:
             logger.debug(f"mas search failed for '{clean_name}': {result.stderr}")
-            return False
+            return None
 
         if result.stdout.strip():
-            # Check if exact match exists in results
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if clean_name.lower() in line.lower():
+            # Check if exact match exists in results, without lowercasing every line
+            name_re = re.compile(re.escape(clean_name), re.IGNORECASE)
+            for line in result.stdout.strip().split('\n'):
+                if name_re.search(line):
                     logger.debug(f"Found Mac App Store match for '{clean_name}': {line}")
                     return True
             logger.debug(f"No exact match found in App Store search results for '{clean_name}'")
@@ -65,10 +174,45 @@ def is_mas_app_by_search(app_name):
         return False
     except subprocess.TimeoutExpired:
         logger.warning(f"Timeout during mas search for '{clean_name}'")
-        return False
+        return None
     except subprocess.SubprocessError as e:
         logger.error(f"Subprocess error during mas search for '{clean_name}': {e}")
-        return False
+        return None
     except Exception as e:
         logger.error(f"Unexpected error during mas search for '{clean_name}': {e}")
-        return False
\ No newline at end of file
+        return None
+
+
+def get_mas_installed_names() -> Set[str]:
+    """Get the lowercased names of all apps installed from the Mac App Store
+
+    Runs `mas list` once, so classifying many apps costs a single subprocess
+    instead of one `mas search` per app.
+
+    Returns:
+        Set of lowercased app names (empty if mas is unavailable or fails)
+    """
+    try:
+        result = subprocess.run(["mas", "list"], capture_output=True, text=True, timeout=10)
+    except FileNotFoundError:
+        logger.debug("mas CLI not available for listing App Store apps")
+        return set()
+    except subprocess.TimeoutExpired:
+        logger.warning("Timeout during mas list")
+        return set()
+    except subprocess.SubprocessError as e:
+        logger.error(f"Subprocess error during mas list: {e}")
+        return set()
+
+    if result.returncode != 0:
+        logger.debug(f"mas list failed: {result.stderr}")
+        return set()
+
+    names = set()
+    for line in result.stdout.splitlines():
+        match = _MAS_LIST_LINE_RE.match(line)
+        if match:
+            names.add(match.group(2).lower())
+
+    logger.debug(f"Found {len(names)} apps installed from the App Store")
+    return names
\ No newline at end of file
@@ -5,10 +5,30 @@ like fetching installed casks, to significantly reduce subprocess calls and impr
 performance across the application.
 """
 
+import atexit
+import json
+import logging
+import os
 import subprocess
 import threading
 import time
-from typing import Set, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple, Optional
+
+# Set up logging for this module
+logger = logging.getLogger(__name__)
+
+# On-disk cache shared with HomebrewAPI's cask data
+DISK_CACHE_DIR = Path.home() / ".cache" / "brewhaul"
+DISK_CACHE_TTL = 300  # 5 minutes, matching BrewCache's in-memory TTL
+
+# How long an app without a Homebrew package is remembered as such, in memory
+# and on disk. New casks appear rarely, so this can be much longer than the TTL
+NO_MATCH_TTL = 1800  # 30 minutes
+NO_MATCH_CACHE_FILE = DISK_CACHE_DIR / "no-match.json"
+
+# Homebrew prefixes to probe for the Caskroom, in order of preference
+HOMEBREW_PREFIXES = ('/opt/homebrew', '/usr/local')
 
 
 class BrewCache:
@@ -50,14 +70,21 @@ class BrewCache:
         # Cache settings
         self._ttl = 300  # 5 minutes TTL
 
-        # Installed casks cache
-        self._installed_casks: Optional[Set[str]] = None
+        # Installed casks cache, immutable so it can be handed out without copying
+        self._installed_casks: Optional[FrozenSet[str]] = None
         self._installed_casks_timestamp: float = 0.0
 
         # Cask names cache (for brew list --cask)
-        self._cask_names: Optional[list] = None
+        self._cask_names: Optional[Tuple[str, ...]] = None
         self._cask_names_timestamp: float = 0.0
 
+        # App name -> time it was found to have no Homebrew package, loaded
+        # from disk on first use and written back once at exit if it changed.
+        # It has its own lock so lookup threads don't contend with the cask caches
+        self._no_match: Optional[Dict[str, float]] = None
+        self._no_match_dirty = False
+        self._no_match_lock = threading.Lock()
+
     def is_cache_valid(self, timestamp: float) -> bool:
         """Check if cache timestamp is still valid based on TTL.
 
@@ -69,7 +96,7 @@ class BrewCache:
         """
         return (time.time() - timestamp) < self._ttl
 
-    def get_installed_casks(self, force_refresh: bool = False) -> Set[str]:
+    def get_installed_casks(self, force_refresh: bool = False) -> FrozenSet[str]:
         """Get installed Homebrew casks with caching.
 
         This method caches the result of 'brew list --cask' to avoid repeated
@@ -79,30 +106,38 @@ class BrewCache:
             force_refresh: If True, bypass cache and fetch fresh data
 
         Returns:
-            Set of installed cask token names
+            Frozen set of installed cask token names
         """
         with self._cache_lock:
-            # Check if we need to refresh the cache
-            if (force_refresh or
-                self._installed_casks is None or
-                not self.is_cache_valid(self._installed_casks_timestamp)):
+            self._ensure_installed_casks(force_refresh)
+            return self._installed_casks
 
-                self._installed_casks = self._fetch_installed_casks()
-                self._installed_casks_timestamp = time.time()
+    def _ensure_installed_casks(self, force_refresh: bool = False):
+        """Fetch the installed casks if they aren't cached or the cache expired.
 
-            return self._installed_casks.copy() if self._installed_casks else set()
+        Must be called with _cache_lock held.
 
-    def get_cask_names(self, force_refresh: bool = False) -> list:
-        """Get list of installed cask names with caching.
+        Args:
+            force_refresh: If True, bypass cache and fetch fresh data
+        """
+        if (force_refresh or
+            self._installed_casks is None or
+            not self.is_cache_valid(self._installed_casks_timestamp)):
+
+            self._installed_casks = self._fetch_installed_casks()
+            self._installed_casks_timestamp = time.time()
+
+    def get_cask_names(self, force_refresh: bool = False) -> Tuple[str, ...]:
+        """Get sorted installed cask names with caching.
 
-        This is similar to get_installed_casks but returns a sorted list
-        instead of a set, for backward compatibility with existing code.
+        This is similar to get_installed_casks but returns a sorted tuple
+        instead of a set, for code that needs the names in order.
 
         Args:
             force_refresh: If True, bypass cache and fetch fresh data
 
         Returns:
-            Sorted list of installed cask names
+            Sorted tuple of installed cask names
         """
         with self._cache_lock:
             # Check if we need to refresh the cache
@@ -111,19 +146,19 @@ class BrewCache:
                 not self.is_cache_valid(self._cask_names_timestamp)):
 
                 casks_set = self._fetch_installed_casks()
-                self._cask_names = sorted(list(casks_set)) if casks_set else []
+                self._cask_names = tuple(sorted(casks_set))
                 self._cask_names_timestamp = time.time()
 
-            return self._cask_names.copy() if self._cask_names else []
+            return self._cask_names
 
-    def _fetch_installed_casks(self) -> Set[str]:
+    def _fetch_installed_casks(self) -> FrozenSet[str]:
         """Fetch installed casks from Homebrew.
 
         This is the actual subprocess call to 'brew list --cask'.
         It's private to ensure caching is always used.
 
         Returns:
-            Set of installed cask tokens
+            Frozen set of installed cask tokens
         """
         # Import here to avoid circular imports
         from utils.ui import subprocess_counter
@@ -140,12 +175,77 @@ class BrewCache:
             )
 
             if result.returncode == 0 and result.stdout:
-                casks = result.stdout.strip().split('\n')
-                return set(cask.strip() for cask in casks if cask.strip())
+                # Built straight from the lines, with no intermediate list or set
+                return frozenset(cask for cask in map(str.strip, result.stdout.splitlines()) if cask)
         except (subprocess.TimeoutExpired, subprocess.SubprocessError):
             pass
+        except OSError as e:
+            # e.g. brew isn't installed at all
+            logger.debug(f"Could not run brew list --cask: {e}")
+
+        return frozenset()
+
+    def is_known_no_match(self, app_name: str) -> bool:
+        """Check if an app was recently found to have no Homebrew package.
+
+        Args:
+            app_name: Name of the app
+
+        Returns:
+            True if the app had no match within the last NO_MATCH_TTL seconds
+        """
+        with self._no_match_lock:
+            self._ensure_no_match_loaded()
+            timestamp = self._no_match.get(app_name)
+        return timestamp is not None and time.time() - timestamp < NO_MATCH_TTL
 
-        return set()
+    def cache_no_match(self, app_name: str):
+        """Remember that an app has no Homebrew package, across runs too.
+
+        The cache is written to disk once, when the process exits, rather than
+        after every lookup.
+
+        Args:
+            app_name: Name of the app
+        """
+        with self._no_match_lock:
+            self._ensure_no_match_loaded()
+            self._no_match[app_name] = time.time()
+            if not self._no_match_dirty:
+                self._no_match_dirty = True
+                atexit.register(self._save_no_match)
+
+    def _save_no_match(self):
+        """Write the no-match cache to disk if it changed, replacing the file atomically."""
+        with self._no_match_lock:
+            if not self._no_match_dirty:
+                return
+            try:
+                DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                temp_file = NO_MATCH_CACHE_FILE.with_name(NO_MATCH_CACHE_FILE.name + '.tmp')
+                with open(temp_file, 'w') as f:
+                    json.dump(self._no_match, f)
+                os.replace(temp_file, NO_MATCH_CACHE_FILE)
+                self._no_match_dirty = False
+            except (OSError, TypeError) as e:
+                logger.warning(f"Could not save no-match cache: {e}")
+
+    def _ensure_no_match_loaded(self):
+        """Load the unexpired no-match entries from disk if not loaded yet.
+
+        Must be called with _no_match_lock held.
+        """
+        if self._no_match is not None:
+            return
+
+        self._no_match = {}
+        try:
+            with open(NO_MATCH_CACHE_FILE, 'r') as f:
+                entries = json.load(f)
+            now = time.time()
+            self._no_match = {name: ts for name, ts in entries.items() if now - ts < NO_MATCH_TTL}
+        except (OSError, ValueError, AttributeError, TypeError):
+            pass
 
     def refresh_cache(self):
         """Force refresh all cached data.
@@ -159,6 +259,22 @@ class BrewCache:
             self._cask_names = None
             self._cask_names_timestamp = 0.0
 
+    def mark_cask_installed(self, cask_token: str):
+        """Record a cask that was just installed in the cached data.
+
+        Keeps the cache in step with Homebrew after an install without
+        refetching the list of installed casks. Caches that haven't been
+        fetched yet are left alone.
+
+        Args:
+            cask_token: The cask token that was installed
+        """
+        with self._cache_lock:
+            if self._installed_casks is not None:
+                self._installed_casks = self._installed_casks | {cask_token}
+            if self._cask_names is not None and cask_token not in self._cask_names:
+                self._cask_names = tuple(sorted(self._cask_names + (cask_token,)))
+
     def is_cask_installed(self, cask_token: str) -> bool:
         """Check if a specific cask is installed using cached data.
 
@@ -168,8 +284,15 @@ class BrewCache:
         Returns:
             True if the cask is installed
         """
-        installed_casks = self.get_installed_casks()
-        return cask_token in installed_casks
+        # The set is immutable and only ever replaced, so while it is fresh it
+        # can be read without taking the lock
+        installed_casks = self._installed_casks
+        if installed_casks is not None and self.is_cache_valid(self._installed_casks_timestamp):
+            return cask_token in installed_casks
+
+        with self._cache_lock:
+            self._ensure_installed_casks()
+            return cask_token in self._installed_casks
 
     def get_cache_stats(self) -> dict:
         """Get cache statistics for debugging/monitoring.
@@ -196,6 +319,10 @@ class BrewCache:
             }
 
 
+# The singleton instance, created once at import so that getting it takes no lock
+_brew_cache = BrewCache()
+
+
 # Convenience function to get the singleton instance
 def get_brew_cache() -> BrewCache:
     """Get the BrewCache singleton instance.
@@ -203,4 +330,78 @@ def get_brew_cache() -> BrewCache:
     Returns:
         The singleton BrewCache instance
     """
-    return BrewCache()
\ No newline at end of file
+    return _brew_cache
+
+
+def get_caskroom_paths() -> List[str]:
+    """Get the candidate Caskroom directories, in order of preference.
+
+    Returns:
+        Caskroom paths under $HOMEBREW_PREFIX and the standard prefixes
+        (they may not exist)
+    """
+    prefixes = [os.environ.get('HOMEBREW_PREFIX'), *HOMEBREW_PREFIXES]
+    return [os.path.join(prefix, 'Caskroom') for prefix in prefixes if prefix]
+
+
+def _homebrew_state_mtime() -> float:
+    """Get the latest modification time of the directories Homebrew data depends on.
+
+    The Caskroom changes whenever a cask is installed or removed, and
+    /Applications changes whenever an app bundle is added or removed.
+
+    Returns:
+        Most recent mtime, or 0.0 if none of the directories exist
+    """
+    paths = get_caskroom_paths()
+    paths.append('/Applications')
+
+    latest = 0.0
+    for path in paths:
+        try:
+            latest = max(latest, os.stat(path).st_mtime)
+        except OSError:
+            continue
+    return latest
+
+
+def cached_brew_data(key: str, fetch: Callable[[], Any], ttl: float = DISK_CACHE_TTL) -> Any:
+    """Get Homebrew data from the on-disk cache, or fetch and persist it.
+
+    Cached values survive across brewhaul invocations so repeated runs skip
+    the underlying brew subprocesses. An entry is reused only while it is
+    younger than ttl and neither the Caskroom nor /Applications has changed
+    since it was written.
+
+    Args:
+        key: Cache entry name (used as the file name)
+        fetch: Callable producing a JSON-serialisable value on a cache miss
+        ttl: Maximum age of a cache entry in seconds
+
+    Returns:
+        The cached or freshly fetched value
+    """
+    cache_file = DISK_CACHE_DIR / f"{key}.json"
+
+    try:
+        with open(cache_file, 'r') as f:
+            entry = json.load(f)
+        timestamp = entry['ts']
+        if time.time() - timestamp < ttl and _homebrew_state_mtime() <= timestamp:
+            logger.debug(f"Using on-disk cache for {key}")
+            return entry['val']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    value = fetch()
+
+    # Don't persist empty results, they usually mean the fetch failed
+    if value:
+        try:
+            DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump({'ts': time.time(), 'val': value}, f)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not save {key} cache: {e}")
+
+    return value
@@ -1,28 +1,35 @@
 """Homebrew package manager operations."""
 
 import os
+import json
 import subprocess
 import re
 import shlex
+import shutil
 import logging
 from utils.ui import Colors, progress_wrapper
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
+# Trailing version number in an app name, e.g. "-95.0" in "MKVToolNix-95.0"
+_VERSION_SUFFIX_RE = re.compile(r'[-_]\d+(\.\d+)*$')
+
+# Descriptions mentioning any of these are taken for development tools (plain
+# substring matches, e.g. "cli" also matches "client")
+_DEV_KEYWORDS_RE = re.compile(r'sdk|api|cli|command|library|framework')
+
 
 def check_homebrew_installed():
     """Check if Homebrew is installed with improved error reporting"""
     try:
-        result = subprocess.run(["which", "brew"], check=True, capture_output=True, text=True)
-        logger.debug(f"Homebrew found at: {result.stdout.strip()}")
+        # Resolve the binary on PATH in-process rather than spawning `which`
+        brew_path = shutil.which("brew")
+        if brew_path is None:
+            logger.info("Homebrew is not installed or not in PATH")
+            return False
+        logger.debug(f"Homebrew found at: {brew_path}")
         return True
-    except subprocess.CalledProcessError:
-        logger.info("Homebrew is not installed or not in PATH")
-        return False
-    except FileNotFoundError:
-        logger.error("'which' command not found - unable to check for Homebrew")
-        return False
     except Exception as e:
         logger.error(f"Unexpected error checking for Homebrew: {e}")
         return False
@@ -70,46 +77,55 @@ def get_brew_apps(force_refresh: bool = False):
 
 def get_brew_app_paths():
     """Get paths of all Homebrew cask installed applications using API data with batch optimization"""
-    from .homebrew_api import HomebrewAPI
-    from utils.app_metadata import get_bundle_identifier
-    import glob
+    from .homebrew_api import get_api
+    from utils.app_metadata import get_app_metadata_batch
 
     brew_app_paths = []
-    api = HomebrewAPI()
+    api = get_api()
 
     # Load API data
-    if not api.load_data():
+    if not api.ensure_loaded():
         logger.warning("Could not load Homebrew API data for path detection")
         return brew_app_paths
 
-    # Get all installed apps from /Applications
-    app_files = glob.glob("/Applications/*.app")
+    # Get all installed apps from /Applications in one directory read, skipping
+    # hidden entries like glob("*.app") would
+    try:
+        with os.scandir("/Applications") as entries:
+            app_files = [entry.path for entry in entries
+                         if entry.name.endswith(".app") and not entry.name.startswith(".")]
+    except OSError as e:
+        logger.warning(f"Could not list /Applications: {e}")
+        app_files = []
 
     if not app_files:
         return brew_app_paths
 
-    # Batch processing: collect all app names and bundle IDs first
-    app_names = [os.path.basename(app_path).replace('.app', '') for app_path in app_files]
+    # Batch processing: collect all app names and bundle IDs first. Every path
+    # ends in ".app", so slicing it off is enough
+    app_names = [os.path.basename(app_path)[:-4] for app_path in app_files]
 
     # Batch lookup by app names
     name_results = api.find_casks_batch(app_names)
 
-    # Track which apps were found by name
-    found_by_name = set()
-    for i, app_path in enumerate(app_files):
-        app_name = app_names[i]
+    # Split the apps into those found by name and the rest in one pass
+    remaining_apps = []
+    for app_path, app_name in zip(app_files, app_names):
         if name_results.get(app_name):
             brew_app_paths.append(app_path)
-            found_by_name.add(app_path)
+        else:
+            remaining_apps.append(app_path)
 
     # For remaining apps, try bundle ID matching in batch
-    remaining_apps = [app_path for app_path in app_files if app_path not in found_by_name]
     if remaining_apps:
         bundle_ids = []
         app_path_to_bundle_id = {}
 
-        for app_path in remaining_apps:
-            bundle_id = get_bundle_identifier(app_path)
+        # One mdls process reads the bundle IDs of all remaining apps
+        remaining_metadata = get_app_metadata_batch(remaining_apps)
+
+        for app_path, app_metadata in remaining_metadata.items():
+            bundle_id = app_metadata['bundle_id']
             if bundle_id:
                 bundle_ids.append(bundle_id)
                 app_path_to_bundle_id[bundle_id] = app_path
@@ -137,20 +153,23 @@ def filter_cask_results(casks, app_name, exclude_fonts=True, exclude_dev_tools=T
 
     for cask_name, description in casks:
         cask_lower = cask_name.lower()
-        desc_lower = description.lower()
+        # Only lowercase the description if one of the checks below reads it
+        desc_lower = description.lower() if exclude_fonts or exclude_dev_tools else ''
 
         # Skip fonts if requested
         if exclude_fonts and ('font-' in cask_lower or 'font' in desc_lower):
             continue
 
+        # An exact match is also a substring match, so one test covers both
+        matches_app = app_base in cask_lower
+
         # Skip development tools that don't match closely
-        if exclude_dev_tools and app_base not in cask_lower:
-            dev_keywords = ['sdk', 'api', 'cli', 'command', 'library', 'framework']
-            if any(keyword in desc_lower for keyword in dev_keywords):
+        if exclude_dev_tools and not matches_app:
+            if _DEV_KEYWORDS_RE.search(desc_lower):
                 continue
 
         # Prioritize exact matches
-        if app_base == cask_lower or app_base in cask_lower:
+        if matches_app:
             filtered_casks.insert(0, (cask_name, description))
         else:
             filtered_casks.append((cask_name, description))
@@ -194,28 +213,79 @@ def check_brew_equivalent_with_api(app_name, app_path, api, exclude_fonts=True,
 
                 return [(token, desc)]
 
-    # Fall back to brew search for cases not in API
-    return _fallback_brew_search(app_name, exclude_fonts, exclude_dev_tools)
+    # Fall back to brew search for cases not in API, unless it recently found
+    # nothing for this app
+    from .brew_cache import get_brew_cache
+    brew_cache = get_brew_cache()
+    if brew_cache.is_known_no_match(app_name):
+        return []
+
+    casks = _fallback_brew_search(app_name, exclude_fonts, exclude_dev_tools)
+    if casks is None:
+        # The search failed; try again next time rather than remembering no match
+        return []
+    if not casks:
+        brew_cache.cache_no_match(app_name)
+    return casks
 
 
 def check_brew_equivalent(app_name, app_path=None, exclude_fonts=True, exclude_dev_tools=True):
     """Enhanced check for Homebrew packages using API-based matching with fallback to brew search"""
-    from .homebrew_api import HomebrewAPI
+    from .homebrew_api import get_api
 
     # Try API-based matching first
-    api = HomebrewAPI()
+    api = get_api()
     return check_brew_equivalent_with_api(app_name, app_path, api, exclude_fonts, exclude_dev_tools)
 
 
+def _get_cask_descriptions(cask_names):
+    """Get (token, description) pairs for several casks from one brew info call
+
+    Returns:
+        List of (token, description) tuples, or None if brew info failed
+    """
+    try:
+        # Use array form to prevent shell injection
+        info_result = subprocess.run(
+            ["brew", "info", "--cask", "--json=v2", *cask_names],
+            capture_output=True, text=True, timeout=30
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning(f"Timeout getting info for casks {', '.join(cask_names)}")
+        return None
+    except subprocess.SubprocessError as e:
+        logger.debug(f"Subprocess error getting info for casks {', '.join(cask_names)}: {e}")
+        return None
+
+    if info_result.returncode != 0:
+        logger.debug(f"Brew info failed for casks {', '.join(cask_names)}: {info_result.stderr}")
+        return None
+
+    try:
+        casks = json.loads(info_result.stdout).get('casks', [])
+    except (json.JSONDecodeError, AttributeError) as e:
+        logger.debug(f"Could not parse brew info output for casks {', '.join(cask_names)}: {e}")
+        return None
+
+    return [(cask['token'], cask.get('desc') or "") for cask in casks if cask.get('token')]
+
+
 def _fallback_brew_search(app_name, exclude_fonts=True, exclude_dev_tools=True):
-    """Fall back to brew search for cases not in API"""
+    """Fall back to brew search for cases not in API
+
+    Returns:
+        List of (token, description) tuples, or None if the search failed
+        (as opposed to finding nothing), so the caller doesn't mistake it for
+        the app having no package
+    """
     # (but with much simpler logic since API should handle most cases)
     clean_name_for_search = app_name.replace(".app", "")
     casks = []
+    failed = False
 
     try:
         # Remove version numbers from app names (e.g., "MKVToolNix-95.0" -> "MKVToolNix")
-        base_name = re.sub(r'[-_]\d+(\.\d+)*$', '', clean_name_for_search)
+        base_name = _VERSION_SUFFIX_RE.sub('', clean_name_for_search)
 
         # Try a simple search with the base name
         name_variations = [
@@ -242,62 +312,51 @@ def _fallback_brew_search(app_name, exclude_fonts=True, exclude_dev_tools=True):
                 )
 
                 if search_result.returncode != 0:
-                    logger.debug(f"Brew search failed for '{variation}': {search_result.stderr}")
+                    # brew search also exits nonzero when nothing matches
+                    if "No formulae or casks found" not in search_result.stderr:
+                        logger.debug(f"Brew search failed for '{variation}': {search_result.stderr}")
+                        failed = True
                     continue
 
                 if search_result.stdout.strip():
                     # Found matches
                     cask_names = search_result.stdout.strip().split('\n')
+                    search_base = variation.lower().replace("-", "").replace("_", "").replace(" ", "")
+                    matching_names = []
                     for cask_name in cask_names:
                         if cask_name and not cask_name.startswith("==>") and not cask_name.startswith("Error:"):
                             # Only include exact matches of the base name
                             cask_base = cask_name.lower().replace("-", "").replace("_", "")
-                            search_base = variation.lower().replace("-", "").replace("_", "").replace(" ", "")
                             # Stricter matching: require exact match only
                             if search_base == cask_base:
-                                # Get description using brew info
                                 # Security fix: Validate cask_name to prevent command injection
-                                if not cask_name or not isinstance(cask_name, str) or len(cask_name) > 100:
+                                if len(cask_name) > 100:
                                     continue
+                                matching_names.append(cask_name)
 
-                                try:
-                                    # Use array form to prevent shell injection (already safe, but added validation)
-                                    info_result = subprocess.run(
-                                        ["brew", "info", "--cask", cask_name],
-                                        capture_output=True, text=True, timeout=10
-                                    )
-                                    if info_result.returncode == 0:
-                                        lines = info_result.stdout.strip().split('\n')
-                                        if lines:
-                                            first_line = lines[0]
-                                            if ':' in first_line:
-                                                parts = first_line.split(':', 1)
-                                                if len(parts) >= 2:
-                                                    description = parts[1].strip()
-                                                    if '(' in description:
-                                                        description = description.split('(')[0].strip()
-                                                    found_casks.append((cask_name, description))
-                                                else:
-                                                    found_casks.append((cask_name, ""))
-                                            else:
-                                                found_casks.append((cask_name, ""))
-                                    else:
-                                        logger.debug(f"Brew info failed for cask '{cask_name}': {info_result.stderr}")
-                                except subprocess.TimeoutExpired:
-                                    logger.warning(f"Timeout getting info for cask '{cask_name}'")
-                                except subprocess.SubprocessError as e:
-                                    logger.debug(f"Subprocess error getting info for cask '{cask_name}': {e}")
+                    # Describe every match with a single brew process
+                    if matching_names:
+                        descriptions = _get_cask_descriptions(matching_names)
+                        if descriptions is None:
+                            failed = True
+                        else:
+                            found_casks.extend(descriptions)
 
                     if found_casks:
                         break
 
             except subprocess.TimeoutExpired:
                 logger.warning(f"Timeout during brew search for '{variation}'")
+                failed = True
                 continue
             except subprocess.SubprocessError as e:
                 logger.debug(f"Subprocess error during brew search for '{variation}': {e}")
+                failed = True
                 continue
 
+        if failed and not found_casks:
+            return None
+
         # Apply filtering to results
         casks = filter_cask_results(found_casks, app_name, exclude_fonts, exclude_dev_tools)
 
@@ -306,7 +365,7 @@ def _fallback_brew_search(app_name, exclude_fonts=True, exclude_dev_tools=True):
 
     except subprocess.SubprocessError as e:
         logger.error(f"Subprocess error in check_brew_equivalent: {e}")
-        return []
+        return None
     except Exception as e:
         logger.error(f"Unexpected error in check_brew_equivalent: {e}")
-        return []
+        return None
@@ -2,6 +2,9 @@
 
 import os
 import json
+import functools
+import gzip
+import pickle
 import time
 import urllib.request
 import urllib.error
@@ -9,16 +12,74 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# orjson parses the multi-megabyte cask data several times faster when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
 
+def _token_priority(token: str) -> int:
+    """Sort key preferring stable casks over variants (@beta, @nightly, ...)"""
+    # Penalize variants
+    if '@beta' in token or '@nightly' in token or '@dev' in token or '@insiders' in token:
+        return 1
+    elif '@' in token:
+        return 2
+    else:
+        return 0
+
+
+def _strip_app_suffix(app_name: str) -> str:
+    """Remove a trailing ".app" from an app name"""
+    return app_name[:-4] if app_name.endswith('.app') else app_name
+
+
+def _extract_bundle_ids(artifacts):
+    """Yield the bundle IDs named by the uninstall quit fields of a cask's artifacts"""
+    for artifact in artifacts:
+        if not isinstance(artifact, dict):
+            continue
+        # The uninstall quit field often contains the bundle ID
+        uninstall = artifact.get('uninstall')
+        if not isinstance(uninstall, list):
+            continue
+        for item in uninstall:
+            if not isinstance(item, dict):
+                continue
+            bundle_id = item.get('quit')
+            if isinstance(bundle_id, str):
+                yield bundle_id
+            elif isinstance(bundle_id, list):
+                for bid in bundle_id:
+                    if isinstance(bid, str):
+                        yield bid
+
+
+def _parse_json(raw: bytes):
+    """Parse JSON bytes, with orjson when it is available.
+
+    Raises:
+        json.JSONDecodeError: If raw isn't valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class HomebrewAPI:
     """Client for Homebrew's public API with caching."""
 
     API_URL = "https://formulae.brew.sh/api/cask.json"
     CACHE_DIR = Path.home() / ".cache" / "brewhaul"
     CACHE_FILE = CACHE_DIR / "homebrew-casks.json"
+    # Lookup tables built from CACHE_FILE, so they needn't be rebuilt every run
+    INDEX_FILE = CACHE_DIR / "homebrew-casks.idx.pkl"
+    # Bumped whenever the layout of the lookup tables changes
+    INDEX_VERSION = 1
     CACHE_EXPIRY_HOURS = 24
     # Critical operations cache age threshold (hours)
     CRITICAL_CACHE_AGE_HOURS = 48
@@ -26,10 +87,12 @@ class HomebrewAPI:
     def __init__(self):
         self.cache_dir = self.CACHE_DIR
         self.cache_file = self.CACHE_FILE
-        self._data = None
+        self.index_file = self.INDEX_FILE
+        self._loaded = False  # True once the lookup tables are filled
         self._app_name_to_cask = {}
         self._bundle_id_to_cask = {}
         self._cask_to_info = {}
+        self._match_cache = {}  # cleaned app name -> find_cask_for_app result
         self._last_refresh_check = 0
         self._refresh_check_interval = 300  # Check refresh every 5 minutes
 
@@ -37,28 +100,35 @@ class HomebrewAPI:
         """Create cache directory if it doesn't exist."""
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _is_cache_valid(self) -> bool:
-        """Check if cache exists and is not stale."""
-        if not self.cache_file.exists():
-            return False
+    def _get_cache_mtime(self) -> Optional[float]:
+        """Get the modification time of the cache file, or None if there is none.
 
-        # Check age of cache file
-        cache_age_seconds = time.time() - self.cache_file.stat().st_mtime
-        cache_age_hours = cache_age_seconds / 3600
-        return cache_age_hours < self.CACHE_EXPIRY_HOURS
+        Callers stat the file once with this and pass the result on, rather
+        than each check statting it again.
+        """
+        try:
+            return self.cache_file.stat().st_mtime
+        except OSError:
+            return None
+
+    def _is_cache_valid(self, cache_mtime: Optional[float]) -> bool:
+        """Check if cache exists and is not stale."""
+        cache_age_hours = self._get_cache_age_hours(cache_mtime)
+        return cache_age_hours is not None and cache_age_hours < self.CACHE_EXPIRY_HOURS
 
-    def _get_cache_age_hours(self) -> Optional[float]:
+    def _get_cache_age_hours(self, cache_mtime: Optional[float]) -> Optional[float]:
         """Get the age of the cache file in hours."""
-        if not self.cache_file.exists():
+        if cache_mtime is None:
             return None
 
-        cache_age_seconds = time.time() - self.cache_file.stat().st_mtime
+        cache_age_seconds = time.time() - cache_mtime
         return cache_age_seconds / 3600
 
-    def _should_check_for_refresh(self, critical_operation: bool = False) -> bool:
+    def _should_check_for_refresh(self, cache_mtime: Optional[float], critical_operation: bool = False) -> bool:
         """Check if we should attempt a cache refresh.
 
         Args:
+            cache_mtime: Modification time of the cache file, from _get_cache_mtime()
             critical_operation: If True, use stricter cache age limits
 
         Returns:
@@ -71,7 +141,7 @@ class HomebrewAPI:
 
         self._last_refresh_check = current_time
 
-        cache_age = self._get_cache_age_hours()
+        cache_age = self._get_cache_age_hours(cache_mtime)
         if cache_age is None:
             # No cache, definitely refresh
             return True
@@ -87,8 +157,13 @@ class HomebrewAPI:
         """Fetch cask data from Homebrew API."""
         try:
             logger.info("Fetching Homebrew cask data from API...")
-            with urllib.request.urlopen(self.API_URL, timeout=30) as response:
-                data = json.loads(response.read().decode('utf-8'))
+            # The cask list compresses several times over, so ask for it gzipped
+            request = urllib.request.Request(self.API_URL, headers={'Accept-Encoding': 'gzip'})
+            with urllib.request.urlopen(request, timeout=30) as response:
+                raw = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    raw = gzip.decompress(raw)
+                data = _parse_json(raw)
                 logger.info(f"Successfully fetched {len(data)} casks from API")
                 return data
         except urllib.error.URLError as e:
@@ -101,16 +176,15 @@ class HomebrewAPI:
             logger.error(f"Unexpected error fetching Homebrew API data: {e}")
             return []
 
-    def _load_cache(self) -> Optional[List[Dict]]:
+    def _load_cache(self, cache_mtime: Optional[float]) -> Optional[List[Dict]]:
         """Load cached data if available and valid."""
-        if not self._is_cache_valid():
+        if not self._is_cache_valid(cache_mtime):
             return None
 
         try:
-            with open(self.cache_file, 'r') as f:
-                data = json.load(f)
-                logger.debug(f"Loaded {len(data)} casks from cache")
-                return data
+            data = _parse_json(self.cache_file.read_bytes())
+            logger.debug(f"Loaded {len(data)} casks from cache")
+            return data
         except json.JSONDecodeError as e:
             logger.warning(f"Invalid JSON in cache file: {e}")
             return None
@@ -122,17 +196,71 @@ class HomebrewAPI:
         """Save data to cache file."""
         self._ensure_cache_dir()
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Written compactly, indenting would only make saving and loading slower
+            if orjson is not None:
+                self.cache_file.write_bytes(orjson.dumps(data))
+            else:
+                with open(self.cache_file, 'w') as f:
+                    json.dump(data, f, separators=(',', ':'))
             logger.debug(f"Saved {len(data)} casks to cache")
         except IOError as e:
             logger.warning(f"Could not save cache: {e}")
+            return
+        self._save_index()
+
+    def _load_index(self, cache_mtime: Optional[float]) -> bool:
+        """Load the lookup tables saved for the current cache file.
+
+        The index records the modification time of the cache file it was built
+        from, and is only used while the cache file still has that time.
+
+        Args:
+            cache_mtime: Modification time of the cache file, from _get_cache_mtime()
+
+        Returns:
+            True if the lookup tables were loaded
+        """
+        if cache_mtime is None:
+            return False
+
+        try:
+            with open(self.index_file, 'rb') as f:
+                version, source_mtime, app_name_to_cask, bundle_id_to_cask, cask_to_info = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            # A truncated or outdated index is simply rebuilt
+            logger.debug(f"Could not load lookup index: {e}")
+            return False
+
+        if version != self.INDEX_VERSION or source_mtime != cache_mtime or not cask_to_info:
+            return False
+
+        self._app_name_to_cask = app_name_to_cask
+        self._bundle_id_to_cask = bundle_id_to_cask
+        self._cask_to_info = cask_to_info
+        self._match_cache = {}
+        self._loaded = True
+        logger.debug(f"Loaded lookup tables for {len(cask_to_info)} casks from index")
+        return True
+
+    def _save_index(self):
+        """Save the lookup tables alongside the cache file they were built from."""
+        try:
+            cache_mtime = self.cache_file.stat().st_mtime
+            with open(self.index_file, 'wb') as f:
+                pickle.dump((self.INDEX_VERSION, cache_mtime,
+                             self._app_name_to_cask, self._bundle_id_to_cask, self._cask_to_info),
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError) as e:
+            logger.warning(f"Could not save lookup index: {e}")
 
     def _build_lookup_tables(self, data: List[Dict]):
         """Build lookup tables for fast matching."""
-        self._app_name_to_cask = {}  # Will store name -> list of cask tokens
+        self._app_name_to_cask = {}  # Will store lowercased name -> list of cask tokens
         self._bundle_id_to_cask = {}  # Will store bundle_id -> list of cask tokens
         self._cask_to_info.clear()
+        self._match_cache = {}
 
         for cask in data:
             token = cask.get('token', '')
@@ -153,42 +281,30 @@ class HomebrewAPI:
                 'disable_reason': cask.get('disable_reason'),
             }
 
-            # Build app name lookup (store as list to handle multiple casks per app)
+            # Build app name lookup (store as list to handle multiple casks per app).
+            # Only lowercase names are stored; exact case matches are a subset
             names = cask.get('name', [])
             for name in names:
                 if name:
-                    # Store exact name
-                    if name not in self._app_name_to_cask:
-                        self._app_name_to_cask[name] = []
-                    self._app_name_to_cask[name].append(token)
-
-                    # Store lowercase version for case-insensitive matching
-                    lower_name = name.lower()
-                    if lower_name not in self._app_name_to_cask:
-                        self._app_name_to_cask[lower_name] = []
-                    if token not in self._app_name_to_cask[lower_name]:
-                        self._app_name_to_cask[lower_name].append(token)
+                    tokens = self._app_name_to_cask.setdefault(name.lower(), [])
+                    if token not in tokens:
+                        tokens.append(token)
 
             # Extract bundle IDs from artifacts if available
-            artifacts = cask.get('artifacts', [])
-            for artifact in artifacts:
-                if isinstance(artifact, dict):
-                    # Check for uninstall quit field which often contains bundle ID
-                    uninstall = artifact.get('uninstall', [])
-                    if isinstance(uninstall, list):
-                        for item in uninstall:
-                            if isinstance(item, dict) and 'quit' in item:
-                                bundle_id = item['quit']
-                                if isinstance(bundle_id, str):
-                                    if bundle_id not in self._bundle_id_to_cask:
-                                        self._bundle_id_to_cask[bundle_id] = []
-                                    self._bundle_id_to_cask[bundle_id].append(token)
-                                elif isinstance(bundle_id, list):
-                                    for bid in bundle_id:
-                                        if isinstance(bid, str):
-                                            if bid not in self._bundle_id_to_cask:
-                                                self._bundle_id_to_cask[bid] = []
-                                            self._bundle_id_to_cask[bid].append(token)
+            for bundle_id in _extract_bundle_ids(cask.get('artifacts', ())):
+                self._bundle_id_to_cask.setdefault(bundle_id, []).append(token)
+
+        # Order every token list by preference once, rather than on each lookup
+        for tokens in self._app_name_to_cask.values():
+            if len(tokens) > 1:
+                tokens.sort(key=_token_priority)
+        for tokens in self._bundle_id_to_cask.values():
+            if len(tokens) > 1:
+                tokens.sort(key=_token_priority)
+
+        # The tables are complete. Only they are kept on the instance; data isn't
+        # stored, so the raw cask list is freed once the caller is done with it
+        self._loaded = True
 
     def load_data(self, force_refresh: bool = False, critical_operation: bool = False) -> bool:
         """Load cask data from cache or API with intelligent refresh.
@@ -200,97 +316,117 @@ class HomebrewAPI:
         Returns:
             True if data loaded successfully, False otherwise
         """
+        # The cache file is statted once, every check below works from its mtime
+        cache_mtime = self._get_cache_mtime()
+
         # Check if we should attempt a refresh based on cache age and operation type
-        should_refresh = force_refresh or self._should_check_for_refresh(critical_operation)
+        should_refresh = force_refresh or self._should_check_for_refresh(cache_mtime, critical_operation)
+
+        # Try to load from cache first if not forcing refresh. Whatever was read
+        # is kept for the fallback below, so the file is parsed at most once
+        cached_data = None
+        cache_read = False
+        if not force_refresh and not should_refresh and self._is_cache_valid(cache_mtime):
+            if self._load_index(cache_mtime):
+                return True
 
-        # Try to load from cache first if not forcing refresh
-        if not force_refresh and not should_refresh:
-            cached_data = self._load_cache()
+            cached_data = self._load_cache(cache_mtime)
+            cache_read = True
             if cached_data:
-                self._data = cached_data
                 self._build_lookup_tables(cached_data)
+                self._save_index()
                 return True
 
         # Try background refresh for critical operations
         if should_refresh:
-            cache_age = self._get_cache_age_hours()
+            cache_age = self._get_cache_age_hours(cache_mtime)
             if cache_age is not None:
                 logger.info(f"Cache is {cache_age:.1f} hours old, attempting refresh...")
 
             # Fetch from API
             api_data = self._fetch_from_api()
             if api_data:
-                self._data = api_data
-                self._save_cache(api_data)
+                # Tables first, as saving the cache also saves them
                 self._build_lookup_tables(api_data)
+                self._save_cache(api_data)
                 return True
             else:
                 logger.warning("API fetch failed, falling back to cache if available")
 
         # Fall back to existing cache (even if stale) if API fails
         if not force_refresh:
-            try:
-                with open(self.cache_file, 'r') as f:
-                    cached_data = json.load(f)
-                    if cached_data:
-                        cache_age = self._get_cache_age_hours()
-                        if cache_age is not None:
-                            logger.info(f"Using cache that is {cache_age:.1f} hours old")
-                        self._data = cached_data
-                        self._build_lookup_tables(cached_data)
-                        return True
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Could not load fallback cache: {e}")
+            cache_age = self._get_cache_age_hours(cache_mtime)
+            if not cache_read and cache_age is not None:
+                if self._load_index(cache_mtime):
+                    logger.info(f"Using cache that is {cache_age:.1f} hours old")
+                    return True
+                try:
+                    cached_data = _parse_json(self.cache_file.read_bytes())
+                except (json.JSONDecodeError, IOError) as e:
+                    logger.error(f"Could not load fallback cache: {e}")
+
+            if cached_data:
+                if cache_age is not None:
+                    logger.info(f"Using cache that is {cache_age:.1f} hours old")
+                self._build_lookup_tables(cached_data)
+                self._save_index()
+                return True
 
         return False
 
+    def ensure_loaded(self) -> bool:
+        """Load cask data unless it has already been loaded.
+
+        Returns:
+            True if data is available, False otherwise
+        """
+        return self._loaded or self.load_data()
+
     def find_cask_for_app(self, app_name: str) -> Optional[Tuple[str, Dict]]:
         """Find the best matching cask for an app name.
 
+        Results are memoized per cleaned app name until the data is reloaded,
+        so e.g. "Foo.app" and "Foo" share an entry.
+
         Returns:
             Tuple of (cask_token, cask_info) or None if no match found
         """
-        if not self._data:
+        if not self._loaded:
             if not self.load_data():
                 return None
 
         # Clean the app name
-        clean_name = app_name.replace('.app', '').strip()
-
-        # Collect all potential matches
-        candidates = []
-
-        # Try exact match first
-        if clean_name in self._app_name_to_cask:
-            tokens = self._app_name_to_cask[clean_name]
-            candidates.extend(tokens)
+        clean_name = _strip_app_suffix(app_name).strip()
 
-        # Try lowercase match
-        if clean_name.lower() in self._app_name_to_cask:
-            tokens = self._app_name_to_cask[clean_name.lower()]
-            for token in tokens:
-                if token not in candidates:
-                    candidates.append(token)
+        try:
+            return self._match_cache[clean_name]
+        except KeyError:
+            pass
+
+        result = self._match_cask_for_app(clean_name)
+        self._match_cache[clean_name] = result
+        return result
+
+    def _match_cask_for_app(self, clean_name: str) -> Optional[Tuple[str, Dict]]:
+        """Look up the best matching cask for a cleaned app name in the loaded data."""
+        # Collect all potential matches (case-insensitive), already ordered to
+        # prefer stable versions
+        candidates = self._app_name_to_cask.get(clean_name.lower())
+        if not candidates:
+            return None
 
-        # If we have multiple candidates, prefer stable versions
+        token = candidates[0]
+        # Among the most preferred candidates, an exact case match wins
         if len(candidates) > 1:
-            # Sort candidates to prefer stable versions
-            def sort_key(token):
-                # Penalize variants
-                if '@beta' in token or '@nightly' in token or '@dev' in token or '@insiders' in token:
-                    return 1
-                elif '@' in token:
-                    return 2
-                else:
-                    return 0
-
-            candidates.sort(key=sort_key)
-
-        if candidates:
-            token = candidates[0]
-            return (token, self._cask_to_info[token])
+            best_priority = _token_priority(token)
+            for candidate in candidates:
+                if _token_priority(candidate) != best_priority:
+                    break
+                if clean_name in self._cask_to_info[candidate]['names']:
+                    token = candidate
+                    break
 
-        return None
+        return (token, self._cask_to_info[token])
 
     def find_cask_by_bundle_id(self, bundle_id: str) -> Optional[Tuple[str, Dict]]:
         """Find cask by bundle identifier.
@@ -298,32 +434,20 @@ class HomebrewAPI:
         Returns:
             Tuple of (cask_token, cask_info) or None if no match found
         """
-        if not self._data:
+        if not self._loaded:
             if not self.load_data():
                 return None
 
         if bundle_id in self._bundle_id_to_cask:
-            tokens = self._bundle_id_to_cask[bundle_id]
-
-            # If multiple tokens, prefer stable version
-            if len(tokens) > 1:
-                def sort_key(token):
-                    if '@beta' in token or '@nightly' in token or '@dev' in token or '@insiders' in token:
-                        return 1
-                    elif '@' in token:
-                        return 2
-                    else:
-                        return 0
-                tokens = sorted(tokens, key=sort_key)
-
-            token = tokens[0]
+            # Tokens are already ordered to prefer stable versions
+            token = self._bundle_id_to_cask[bundle_id][0]
             return (token, self._cask_to_info[token])
 
         return None
 
     def get_all_cask_tokens(self) -> List[str]:
         """Get all available cask tokens."""
-        if not self._data:
+        if not self._loaded:
             if not self.load_data():
                 return []
         return list(self._cask_to_info.keys())
@@ -350,7 +474,7 @@ class HomebrewAPI:
         Returns:
             Tuple of (is_deprecated, reason_message)
         """
-        if not self._data:
+        if not self._loaded:
             if not self.load_data():
                 return (False, None)
 
@@ -385,26 +509,31 @@ class HomebrewAPI:
         Returns:
             Dictionary with cache status information
         """
-        cache_age = self._get_cache_age_hours()
+        cache_mtime = self._get_cache_mtime()
         return {
-            'cache_file_exists': self.cache_file.exists(),
-            'cache_age_hours': cache_age,
-            'cache_valid': self._is_cache_valid(),
-            'data_loaded': self._data is not None,
-            'cask_count': len(self._cask_to_info) if self._data else 0,
+            'cache_file_exists': cache_mtime is not None,
+            'cache_age_hours': self._get_cache_age_hours(cache_mtime),
+            'cache_valid': self._is_cache_valid(cache_mtime),
+            'data_loaded': self._loaded,
+            'cask_count': len(self._cask_to_info) if self._loaded else 0,
             'last_refresh_check': self._last_refresh_check,
             'cache_file_path': str(self.cache_file)
         }
 
     def clear_cache(self):
         """Clear the cache file."""
+        try:
+            self.index_file.unlink()
+        except FileNotFoundError:
+            pass
         if self.cache_file.exists():
             self.cache_file.unlink()
             logger.info("Cache cleared")
-            self._data = None
+            self._loaded = False
             self._app_name_to_cask.clear()
             self._bundle_id_to_cask.clear()
             self._cask_to_info.clear()
+            self._match_cache.clear()
 
     def find_casks_batch(self, app_names: List[str]) -> Dict[str, Optional[Tuple[str, Dict]]]:
         """Find casks for multiple app names in a single batch operation.
@@ -419,14 +548,19 @@ class HomebrewAPI:
             Dictionary mapping app names to their cask results
         """
         # Ensure data is loaded once for the entire batch
-        if not self._data:
+        if not self._loaded:
             if not self.load_data():
                 return {app_name: None for app_name in app_names}
 
         results = {}
+        app_name_to_cask = self._app_name_to_cask
 
         # Process all apps in batch
         for app_name in app_names:
+            # Names with no entry in the index can't match, skip the full lookup
+            if _strip_app_suffix(app_name).strip().lower() not in app_name_to_cask:
+                results[app_name] = None
+                continue
             try:
                 result = self.find_cask_for_app(app_name)
                 results[app_name] = result
@@ -447,7 +581,7 @@ class HomebrewAPI:
             Dictionary mapping bundle IDs to their cask results
         """
         # Ensure data is loaded once for the entire batch
-        if not self._data:
+        if not self._loaded:
             if not self.load_data():
                 return {bundle_id: None for bundle_id in bundle_ids}
 
@@ -463,4 +597,18 @@ class HomebrewAPI:
                 results[bundle_id] = None
 
         logger.debug(f"Batch processed {len(bundle_ids)} bundle ID lookups")
-        return results
\ No newline at end of file
+        return results
+
+
+@functools.lru_cache(maxsize=None)
+def get_api() -> HomebrewAPI:
+    """Get the shared HomebrewAPI instance.
+
+    Sharing one instance means the cask data is read and indexed once per
+    run rather than once per caller. Call it from the main thread before
+    handing the instance to worker threads.
+
+    Returns:
+        The process-wide HomebrewAPI instance
+    """
+    return HomebrewAPI()
\ No newline at end of file
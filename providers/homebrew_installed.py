@@ -1,10 +1,15 @@
 """Get installed Homebrew casks efficiently with caching."""
 
-from typing import Set
-from .brew_cache import get_brew_cache
+import logging
+import os
+from typing import AbstractSet, FrozenSet
+from .brew_cache import get_brew_cache, get_caskroom_paths
 
+# Set up logging for this module
+logger = logging.getLogger(__name__)
 
-def get_installed_cask_tokens(force_refresh: bool = False) -> Set[str]:
+
+def get_installed_cask_tokens(force_refresh: bool = False) -> FrozenSet[str]:
     """Get a set of installed Homebrew cask tokens with caching.
 
     This function now uses the BrewCache singleton to cache results,
@@ -14,7 +19,7 @@ def get_installed_cask_tokens(force_refresh: bool = False) -> Set[str]:
         force_refresh: If True, bypass cache and fetch fresh data
 
     Returns:
-        Set of installed cask tokens
+        Frozen set of installed cask tokens (shared, not copied)
     """
     cache = get_brew_cache()
     return cache.get_installed_casks(force_refresh=force_refresh)
@@ -30,4 +35,35 @@ def is_cask_installed(cask_token: str) -> bool:
         True if the cask is installed
     """
     cache = get_brew_cache()
-    return cache.is_cask_installed(cask_token)
\ No newline at end of file
+    return cache.is_cask_installed(cask_token)
+
+
+def list_installed_cask_tokens() -> AbstractSet[str]:
+    """Get installed Homebrew cask tokens by scanning the Caskroom.
+
+    Every installed cask has a directory named after its token in the
+    Caskroom, so one directory listing answers the question without running
+    `brew list --cask`. Falls back to get_installed_cask_tokens() when no
+    Caskroom can be read.
+
+    Returns:
+        Set of installed cask tokens
+    """
+    tokens = set()
+    found_caskroom = False
+
+    for caskroom in get_caskroom_paths():
+        try:
+            with os.scandir(caskroom) as entries:
+                tokens.update(entry.name for entry in entries
+                              if not entry.name.startswith('.') and entry.is_dir())
+            found_caskroom = True
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.debug(f"Could not scan Caskroom at {caskroom}: {e}")
+
+    if not found_caskroom:
+        return get_installed_cask_tokens()
+
+    return tokens
\ No newline at end of file
@@ -0,0 +1,45 @@
+import re
+import unittest
+
+from utils.ui import Colors, _visible_len
+
+# The width calculations _visible_len replaced
+SGR_PATTERN = re.compile(r'\033\[[0-9;]*m')
+CSI_PATTERN = re.compile(r'\033\[[0-?]*[ -/]*[@-~]')
+
+
+class VisibleLenTest(unittest.TestCase):
+
+    def test_matches_color_code_regex(self):
+        samples = [
+            '',
+            'plain text',
+            f'{Colors.GREEN}ok{Colors.RESET}',
+            f'{Colors.BOLD}{Colors.ORANGE}Firefox{Colors.RESET} (firefox)',
+            f'{Colors.YELLOW}⏸ Queue{Colors.RESET}',
+            '\033[m\033[0m\033[38;5;208m',
+            'a\033[1mb\033[0mc',
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                self.assertEqual(_visible_len(text), len(SGR_PATTERN.sub('', text)))
+
+    def test_skips_any_control_sequence(self):
+        samples = [
+            '\033[2Kcleared',
+            '\033[1A\033[10Cmoved',
+            '\033[?25lhidden cursor\033[?25h',
+            '\033[s\033[u',
+            f'{Colors.CYAN}a\033[K{Colors.RESET}b',
+            'trailing \033[',
+            'unterminated \033[12;3',
+            '\033[\033[1mx\033[0m',
+            'a\033[ \x01b',
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                self.assertEqual(_visible_len(text), len(CSI_PATTERN.sub('', text)))
+
+
+if __name__ == '__main__':
+    unittest.main()
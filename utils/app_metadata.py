@@ -1,192 +1,326 @@
 """Utilities for extracting metadata from macOS applications."""
 
+import atexit
 import subprocess
 import os
+import json
+import plistlib
 import functools
+import re
 import logging
-from typing import Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
 
 # Set up logging for this module
 logger = logging.getLogger(__name__)
 
 
-def get_bundle_identifier(app_path: str) -> Optional[str]:
-    """Extract bundle identifier from a macOS application.
+# Spotlight attributes used when Info.plist has no value, and the metadata
+# keys they fill
+_MDLS_ATTRIBUTES = (
+    ('kMDItemCFBundleIdentifier', 'bundle_id'),
+    ('kMDItemVersion', 'version'),
+)
 
-    Args:
-        app_path: Path to the .app directory
+# Info.plist keys read for every app, by the metadata key they fill
+_INFO_PLIST_KEYS = {
+    'bundle_id': 'CFBundleIdentifier',
+    'version': 'CFBundleShortVersionString',
+}
 
-    Returns:
-        Bundle identifier string or None if not found
-    """
+# Trailing version numbers and parenthesized notes, in any order, e.g.
+# "-95.0", "_1.2.3", " (Beta)" or "-2.1 (Beta)"
+_NAME_TAIL_RE = re.compile(r'(?:\s*\([^)]*\)|[-_]\d+(?:\.\d+)*)+\s*$')
+
+# Upper bound on concurrent codesign processes in get_metadata_for_apps
+MAX_METADATA_WORKERS = min(16, (os.cpu_count() or 4) * 2)
+
+# How long get_app_developer reuses a result, in seconds
+DEVELOPER_CACHE_TTL = 60
+
+# app path -> (monotonic expiry time, developer or None)
+_developer_cache = {}
+
+# Metadata is kept across runs next to brewhaul's Homebrew caches. Entries
+# record the Info.plist mtime they were read at, so an app that was updated
+# in the meantime is looked up again
+METADATA_CACHE_FILE = Path.home() / ".cache" / "brewhaul" / "app-metadata.json"
+
+# app path -> [Info.plist mtime in ns, metadata dict], loaded on first use
+_metadata_cache = None
+_metadata_cache_dirty = False
+_metadata_cache_lock = threading.Lock()
+
+
+def _is_safe_app_path(app_path) -> bool:
+    """Check that an app path is safe to pass to a subprocess."""
     # Security fix: Validate input path to prevent command injection
     if not app_path or not isinstance(app_path, str):
-        return None
-
-    if not os.path.exists(app_path):
-        return None
+        return False
 
     # Additional security validation
-    if '..' in app_path or not app_path.startswith('/'):
+    return '..' not in app_path and app_path.startswith('/')
+
+
+def _info_plist_mtime(app_path: str) -> Optional[int]:
+    """Get the modification time of an app's Info.plist in ns, or None if it has none."""
+    try:
+        return os.stat(os.path.join(app_path, 'Contents', 'Info.plist')).st_mtime_ns
+    except OSError:
         return None
 
+
+def _ensure_metadata_cache_loaded() -> dict:
+    """Load the metadata cache from disk if not loaded yet.
+
+    Must be called with _metadata_cache_lock held.
+    """
+    global _metadata_cache
+    if _metadata_cache is None:
+        try:
+            with open(METADATA_CACHE_FILE, 'r') as f:
+                entries = json.load(f)
+            _metadata_cache = entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            _metadata_cache = {}
+    return _metadata_cache
+
+
+def _save_metadata_cache():
+    """Write the metadata cache to disk if it changed, replacing the file atomically."""
+    global _metadata_cache_dirty
+    with _metadata_cache_lock:
+        if not _metadata_cache_dirty:
+            return
+        try:
+            METADATA_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = METADATA_CACHE_FILE.with_name(METADATA_CACHE_FILE.name + '.tmp')
+            with open(temp_file, 'w') as f:
+                json.dump(_metadata_cache, f)
+            os.replace(temp_file, METADATA_CACHE_FILE)
+            _metadata_cache_dirty = False
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not save app metadata cache: {e}")
+
+
+def _cache_metadata(entries: Dict[str, list]):
+    """Add [mtime, metadata] entries to the metadata cache.
+
+    The cache is written to disk once, when the process exits, rather than
+    after every lookup.
+    """
+    global _metadata_cache_dirty
+    with _metadata_cache_lock:
+        _ensure_metadata_cache_loaded().update(entries)
+        if not _metadata_cache_dirty:
+            _metadata_cache_dirty = True
+            atexit.register(_save_metadata_cache)
+
+
+def _query_spotlight(app_paths: List[str]) -> Optional[Dict[str, Dict[str, Optional[str]]]]:
+    """Read the Spotlight attributes of many apps with a single mdls call.
+
+    Returns:
+        Dictionary mapping each app path to its metadata, with None for values
+        Spotlight doesn't have, or None if mdls failed
+    """
+    command = ['mdls']
+    for attribute, _ in _MDLS_ATTRIBUTES:
+        command += ['-name', attribute]
+    # -raw prints just the values, NUL separated, in path then attribute order
+    command += ['-raw', '-nullMarker', '', *app_paths]
+
     try:
-        # Method 1: Use mdls (Spotlight metadata)
-        # Security fix: Path is already validated, using array form for safety
+        # Security fix: Paths are already validated, using array form for safety
         result = subprocess.run(
-            ['mdls', '-name', 'kMDItemCFBundleIdentifier', app_path],
+            command,
             capture_output=True,
             text=True,
-            timeout=5
+            timeout=5 + len(app_paths) // 10
         )
-
-        if result.returncode == 0 and result.stdout:
-            # Parse output: kMDItemCFBundleIdentifier = "com.example.app"
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if 'kMDItemCFBundleIdentifier' in line:
-                    parts = line.split('=')
-                    if len(parts) >= 2:
-                        bundle_id = parts[1].strip().strip('"')
-                        if bundle_id and bundle_id != '(null)':
-                            return bundle_id
-
-        # Method 2: Try reading Info.plist directly
-        info_plist_path = os.path.join(app_path, 'Contents', 'Info.plist')
-        if os.path.exists(info_plist_path):
-            # Security fix: Path is already validated, using array form for safety
-            result = subprocess.run(
-                ['defaults', 'read', info_plist_path, 'CFBundleIdentifier'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0 and result.stdout:
-                bundle_id = result.stdout.strip()
-                if bundle_id:
-                    return bundle_id
-
     except subprocess.TimeoutExpired:
-        logger.warning(f"Timeout while getting bundle identifier for {app_path}")
+        logger.warning(f"Timeout while reading Spotlight metadata for {len(app_paths)} apps")
         return None
-    except subprocess.SubprocessError as e:
-        logger.debug(f"Subprocess error while getting bundle identifier for {app_path}: {e}")
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Could not read Spotlight metadata: {e}")
         return None
-    except Exception as e:
-        logger.error(f"Unexpected error while getting bundle identifier for {app_path}: {e}")
+
+    values = result.stdout.split('\0')
+    if result.returncode != 0 or len(values) != len(app_paths) * len(_MDLS_ATTRIBUTES):
+        logger.debug(f"Unexpected mdls output for {len(app_paths)} apps: {result.stderr.strip()}")
         return None
 
-    return None
+    metadata = {}
+    value_iter = iter(values)
+    for app_path in app_paths:
+        metadata[app_path] = {key: (next(value_iter).strip() or None) for _, key in _MDLS_ATTRIBUTES}
+    return metadata
 
 
-def get_app_version(app_path: str) -> Optional[str]:
-    """Extract version from a macOS application.
+def _read_info_plist(app_path: str) -> Dict[str, Optional[str]]:
+    """Read the metadata an app's Info.plist has, in-process with plistlib.
+
+    Returns:
+        Dictionary with 'bundle_id' and 'version', None where the plist has
+        no string value for them (or there is no readable plist)
+    """
+    metadata = {key: None for key in _INFO_PLIST_KEYS}
+    info_plist_path = os.path.join(app_path, 'Contents', 'Info.plist')
+    try:
+        with open(info_plist_path, 'rb') as f:
+            plist = plistlib.load(f)
+    except FileNotFoundError:
+        return metadata
+    except Exception as e:
+        # Unreadable or malformed plist, Spotlight may still know the values
+        logger.debug(f"Could not read Info.plist for {app_path}: {e}")
+        return metadata
+
+    if isinstance(plist, dict):
+        for key, plist_key in _INFO_PLIST_KEYS.items():
+            value = plist.get(plist_key)
+            if isinstance(value, str) and value.strip():
+                metadata[key] = value.strip()
+    return metadata
+
+
+def get_app_metadata_batch(app_paths: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+    """Extract bundle identifiers and versions for many macOS applications at once.
+
+    Each app's Info.plist is parsed in-process first. Spotlight is only asked
+    about the apps whose plist lacked a value, all in one mdls call. Results
+    are cached across runs until the app's Info.plist changes.
 
     Args:
-        app_path: Path to the .app directory
+        app_paths: Paths to .app directories
 
     Returns:
-        Version string or None if not found
+        Dictionary mapping each valid app path to a dict with 'bundle_id' and
+        'version' (either may be None). Invalid paths are left out
     """
-    # Security fix: Validate input path to prevent command injection
-    if not app_path or not isinstance(app_path, str):
-        return None
+    metadata = {}
+    mtimes = {}
+    for app_path in app_paths:
+        if not _is_safe_app_path(app_path):
+            continue
+        mtime = _info_plist_mtime(app_path)
+        # Finding the Info.plist shows the app exists, the bundle itself only
+        # needs a stat when there is none
+        if mtime is None and not os.path.exists(app_path):
+            continue
+        mtimes[app_path] = mtime
+
+    with _metadata_cache_lock:
+        cache = _ensure_metadata_cache_loaded()
+        for app_path, mtime in mtimes.items():
+            cached = cache.get(app_path)
+            if isinstance(cached, list) and len(cached) == 2 and cached[0] == mtime:
+                metadata[app_path] = cached[1]
+
+    new_entries = {}
+    incomplete = []
+    for app_path, mtime in mtimes.items():
+        if app_path in metadata:
+            continue
+        app_metadata = _read_info_plist(app_path)
+        metadata[app_path] = app_metadata
+        new_entries[app_path] = [mtime, app_metadata]
+        if None in app_metadata.values():
+            incomplete.append(app_path)
+
+    if incomplete:
+        spotlight = _query_spotlight(incomplete)
+        if spotlight is None:
+            # Don't remember the gaps a failed mdls call left, the next run
+            # asks Spotlight again
+            for app_path in incomplete:
+                del new_entries[app_path]
+        else:
+            for app_path, spotlight_metadata in spotlight.items():
+                app_metadata = metadata[app_path]
+                for key, value in spotlight_metadata.items():
+                    if app_metadata[key] is None:
+                        app_metadata[key] = value
+
+    if new_entries:
+        _cache_metadata(new_entries)
+
+    return metadata
 
-    if not os.path.exists(app_path):
-        return None
 
-    # Additional security validation
-    if '..' in app_path or not app_path.startswith('/'):
-        return None
+def get_bundle_identifier(app_path: str) -> Optional[str]:
+    """Extract bundle identifier from a macOS application.
 
-    try:
-        # Try mdls first
-        # Security fix: Path is already validated, using array form for safety
-        result = subprocess.run(
-            ['mdls', '-name', 'kMDItemVersion', app_path],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+    Args:
+        app_path: Path to the .app directory
 
-        if result.returncode == 0 and result.stdout:
-            lines = result.stdout.strip().split('\n')
-            for line in lines:
-                if 'kMDItemVersion' in line:
-                    parts = line.split('=')
-                    if len(parts) >= 2:
-                        version = parts[1].strip().strip('"')
-                        if version and version != '(null)':
-                            return version
-
-        # Try reading from Info.plist
-        info_plist_path = os.path.join(app_path, 'Contents', 'Info.plist')
-        if os.path.exists(info_plist_path):
-            # Security fix: Path is already validated, using array form for safety
-            result = subprocess.run(
-                ['defaults', 'read', info_plist_path, 'CFBundleShortVersionString'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0 and result.stdout:
-                version = result.stdout.strip()
-                if version:
-                    return version
+    Returns:
+        Bundle identifier string or None if not found
+    """
+    return get_app_metadata_batch([app_path]).get(app_path, {}).get('bundle_id')
 
-    except subprocess.TimeoutExpired:
-        logger.warning(f"Timeout while getting app version for {app_path}")
-        return None
-    except subprocess.SubprocessError as e:
-        logger.debug(f"Subprocess error while getting app version for {app_path}: {e}")
-        return None
-    except Exception as e:
-        logger.error(f"Unexpected error while getting app version for {app_path}: {e}")
-        return None
 
-    return None
+def get_app_version(app_path: str) -> Optional[str]:
+    """Extract version from a macOS application.
+
+    Args:
+        app_path: Path to the .app directory
+
+    Returns:
+        Version string or None if not found
+    """
+    return get_app_metadata_batch([app_path]).get(app_path, {}).get('version')
 
 
 def get_app_developer(app_path: str) -> Optional[str]:
     """Extract developer/publisher from a macOS application.
 
+    Results, including not finding a developer, are reused for
+    DEVELOPER_CACHE_TTL seconds so repeated lookups don't rerun codesign.
+
     Args:
         app_path: Path to the .app directory
 
     Returns:
         Developer string or None if not found
     """
-    # Security fix: Validate input path to prevent command injection
-    if not app_path or not isinstance(app_path, str):
+    if not _is_safe_app_path(app_path) or not os.path.exists(app_path):
         return None
 
-    if not os.path.exists(app_path):
-        return None
+    now = time.monotonic()
+    cached = _developer_cache.get(app_path)
+    if cached is not None and cached[0] > now:
+        return cached[1]
 
-    # Additional security validation
-    if '..' in app_path or not app_path.startswith('/'):
-        return None
+    developer = _read_code_signature_developer(app_path)
+    _developer_cache[app_path] = (now + DEVELOPER_CACHE_TTL, developer)
+    return developer
 
+
+def _read_code_signature_developer(app_path: str) -> Optional[str]:
+    """Read the developer from an app's code signature with codesign."""
     try:
         # Try to get code signature info
         # Security fix: Path is already validated, using array form for safety
+        # codesign prints the signature details on stderr
         result = subprocess.run(
             ['codesign', '-dvvv', app_path],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
             timeout=5
         )
 
         if result.returncode == 0 and result.stdout:
-            # Look for Authority line
-            for line in result.stdout.split('\n'):
-                if 'Authority=' in line or 'TeamIdentifier=' in line:
-                    parts = line.split('=')
-                    if len(parts) >= 2:
-                        developer = parts[1].strip()
+            # Look for Authority line. The output is scanned as bytes, only the
+            # value that is returned gets decoded
+            for line in result.stdout.splitlines():
+                if line.startswith((b'Authority=', b'TeamIdentifier=')):
+                    _, separator, value = line.partition(b'=')
+                    if separator:
+                        developer = value.decode('utf-8', 'replace').strip()
                         if developer:
                             return developer
 
@@ -203,13 +337,39 @@ def get_app_developer(app_path: str) -> Optional[str]:
     return None
 
 
-@functools.lru_cache(maxsize=512)
+def get_metadata_for_apps(app_paths: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+    """Extract bundle identifier, version and developer for many applications.
+
+    Bundle identifiers and versions come from get_app_metadata_batch(). The
+    developer needs a codesign process per app, so those run concurrently.
+
+    Args:
+        app_paths: Paths to .app directories
+
+    Returns:
+        Dictionary mapping each valid app path to a dict with 'bundle_id',
+        'version' and 'developer' (any may be None). Invalid paths are left out
+    """
+    metadata = {app_path: dict(app_metadata)
+                for app_path, app_metadata in get_app_metadata_batch(app_paths).items()}
+    if not metadata:
+        return metadata
+
+    with ThreadPoolExecutor(max_workers=min(MAX_METADATA_WORKERS, len(metadata))) as executor:
+        developers = executor.map(get_app_developer, metadata)
+        for app_metadata, developer in zip(metadata.values(), developers):
+            app_metadata['developer'] = developer
+
+    return metadata
+
+
+@functools.lru_cache(maxsize=None)
 def clean_app_name(app_name: str) -> str:
     """Clean up app name for matching.
 
     Removes:
     - .app extension
-    - Version numbers
+    - Trailing version numbers and parenthesized notes
     - Extra whitespace
 
     Args:
@@ -219,22 +379,22 @@ def clean_app_name(app_name: str) -> str:
         Cleaned app name
 
     Performance:
-        - Memoized with LRU cache (maxsize=512) for efficient repeated calls
+        - Memoized without a size limit (the names are bounded by the installed
+          apps), which also skips the LRU bookkeeping on every call
         - Cache hit rate typically 60-80% in typical usage patterns
     """
-    import re
-
-    # Remove .app extension
-    name = app_name.replace('.app', '')
-
-    # Remove version numbers like "-95.0" or "_1.2.3"
-    name = re.sub(r'[-_]\d+(\.\d+)*$', '', name)
+    # Remove .app extension and clean up whitespace
+    name = app_name[:-4] if app_name.endswith('.app') else app_name
+    name = name.strip()
 
-    # Remove version in parentheses like "(Beta)"
-    name = re.sub(r'\s*\([^)]*\)\s*$', '', name)
+    # Most names end in neither a version number nor a parenthesized note,
+    # and there is nothing for the pattern to strip
+    if not name or not (name[-1].isdigit() or name[-1] == ')'):
+        return name
 
-    # Clean up whitespace
-    name = name.strip()
+    # Remove version numbers like "-95.0" and notes in parentheses like
+    # "(Beta)" in one pass
+    name = _NAME_TAIL_RE.sub('', name).strip()
 
     return name
 
@@ -1,11 +1,44 @@
 """User interface utilities for brewhaul."""
 
+import os
 import sys
 import time
 import threading
-import re
+import json
 import signal
 import atexit
+import functools
+
+
+def _visible_len(text):
+    """Length of text as displayed, not counting ANSI escape sequences
+
+    Skips each control sequence (ESC [, parameter and intermediate bytes, then
+    a final byte in @-~) with str.find and a short scan, so the width is
+    counted in one pass without building a stripped copy. An incomplete
+    sequence counts as visible text.
+    """
+    start = text.find('\x1b[')
+    if start < 0:
+        return len(text)
+
+    length = 0
+    position = 0
+    size = len(text)
+    while start >= 0:
+        end = start + 2
+        while end < size and '0' <= text[end] <= '?':
+            end += 1
+        while end < size and ' ' <= text[end] <= '/':
+            end += 1
+        if end < size and '@' <= text[end] <= '~':
+            length += start - position
+            position = end + 1
+            start = text.find('\x1b[', position)
+        else:
+            start = text.find('\x1b[', start + 1)
+    return length + size - position
+
 
 # Terminal colors for better output
 class Colors:
@@ -18,67 +51,133 @@ class Colors:
     CYAN = "\033[36m"
     DIM = "\033[2m"
 
+# Running progress indicators, in start order, and the one thread that animates
+# them all. The thread exits once none are left and is restarted on demand
+_running_indicators = []
+_animator_thread = None
+_registry_lock = threading.Lock()
+_cleanup_handlers_installed = False
+
+# Written on exit or a signal if a progress indicator left the cursor hidden
+_SHOW_CURSOR = b"\033[?25h"
+
+
+def _cleanup_all_indicators(signum=None, frame=None):
+    """Stop all running progress indicators and show the cursor again
+
+    This runs as a signal handler, possibly while the interrupted code holds
+    one of the locks, so it takes none. Copying and clearing a list are single
+    operations, and the cursor is restored with one os.write() that doesn't go
+    through sys.stdout's buffer.
+    """
+    indicators = list(_running_indicators)
+    _running_indicators.clear()
+
+    cursor_hidden = False
+    for indicator in indicators:
+        indicator.running = False
+        cursor_hidden = cursor_hidden or indicator._cursor_hidden
+        indicator._cursor_hidden = False
+
+    if cursor_hidden:
+        try:
+            os.write(sys.stdout.fileno(), _SHOW_CURSOR)
+        except (AttributeError, ValueError, OSError):
+            pass  # Ignore errors during emergency cleanup
+
+
+def _install_cleanup_handlers():
+    """Install the exit and signal handlers that restore the cursor, once.
+
+    The handlers are installed when the first indicator is created rather
+    than at import, so commands that never show one keep Python's default
+    SIGINT handling.
+    """
+    global _cleanup_handlers_installed
+    with _registry_lock:
+        if _cleanup_handlers_installed:
+            return
+
+        # Register signal handlers
+        try:
+            signal.signal(signal.SIGINT, _cleanup_all_indicators)
+            signal.signal(signal.SIGTERM, _cleanup_all_indicators)
+            atexit.register(_cleanup_all_indicators)
+            _cleanup_handlers_installed = True
+        except (ValueError, OSError):
+            # Signal handling might not be available in all contexts (e.g. off
+            # the main thread), the next indicator tries again
+            pass
+
+
+# Prefix of the line a finished progress indicator leaves behind
+_OK_PREFIX = f"{Colors.GREEN}[OK]{Colors.RESET} "
+
+# Spinner frames, colored once rather than on every animation tick
+_SPINNER_FRAMES = tuple(f"{Colors.CYAN}{char}{Colors.RESET} " for char in "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏")
+
+# Every possible progress bar, indexed by the number of filled cells
+_BAR_LENGTH = 20
+_BARS = tuple("█" * filled + "░" * (_BAR_LENGTH - filled) for filled in range(_BAR_LENGTH + 1))
+
+# Seconds between animation frames
+_FRAME_INTERVAL = 0.2
+
+
+def _start_animating(indicator):
+    """Add a started indicator to the animation loop, starting the thread if needed"""
+    global _animator_thread
+    with _registry_lock:
+        _running_indicators.append(indicator)
+        if _animator_thread is None:
+            _animator_thread = threading.Thread(target=_animate_indicators, daemon=True)
+            _animator_thread.start()
+
+
+def _stop_animating(indicator):
+    """Remove an indicator from the animation loop"""
+    with _registry_lock:
+        if indicator in _running_indicators:
+            _running_indicators.remove(indicator)
+
+
+def _animate_indicators():
+    """Animation loop shared by all running progress indicators"""
+    global _animator_thread
+    while True:
+        # Indicators draw their first frame when started
+        time.sleep(_FRAME_INTERVAL)
+        with _registry_lock:
+            if not _running_indicators:
+                _animator_thread = None
+                return
+            indicators = list(_running_indicators)
+
+        for indicator in indicators:
+            if not indicator._render_frame():
+                _stop_animating(indicator)
+
+
 class ProgressIndicator:
     """Simple progress indicator with spinner or progress bar with thread safety"""
 
-    # Class-level registry to track active progress indicators for cleanup
-    _active_indicators = set()
-    _registry_lock = threading.Lock()
-
     def __init__(self, message, total=None):
         self.message = message
         self.total = total
         self.current = 0
-        self.spinner_chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
         self.spinner_index = 0
         self.running = False
-        self.thread = None
+        self._last_output = None
         self._lock = threading.Lock()  # Thread safety for shared state
         self._cursor_hidden = False  # Track cursor state for cleanup
-
-        # Register signal handlers for graceful shutdown
-        self._setup_signal_handlers()
-
-    def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        # Register this indicator for cleanup
-        with ProgressIndicator._registry_lock:
-            ProgressIndicator._active_indicators.add(self)
-
-        # Setup signal handlers (only once)
-        if not hasattr(ProgressIndicator, '_handlers_setup'):
-            def cleanup_all_indicators(signum=None, frame=None):
-                """Cleanup all active progress indicators"""
-                with ProgressIndicator._registry_lock:
-                    indicators_to_cleanup = list(ProgressIndicator._active_indicators)
-
-                for indicator in indicators_to_cleanup:
-                    try:
-                        indicator._emergency_cleanup()
-                    except Exception:
-                        pass  # Ignore errors during emergency cleanup
-
-            # Register signal handlers
-            try:
-                signal.signal(signal.SIGINT, cleanup_all_indicators)
-                signal.signal(signal.SIGTERM, cleanup_all_indicators)
-                atexit.register(cleanup_all_indicators)
-                ProgressIndicator._handlers_setup = True
-            except (ValueError, OSError):
-                # Signal handling might not be available in all contexts
-                pass
-
-    def _emergency_cleanup(self):
-        """Emergency cleanup of progress indicator"""
+        # Only animate on a terminal. Redirected output just gets the final line
         try:
-            with self._lock:
-                self.running = False
-                if self._cursor_hidden:
-                    sys.stdout.write("\033[?25h")  # Restore cursor
-                    sys.stdout.flush()
-                    self._cursor_hidden = False
-        except Exception:
-            pass  # Ignore all errors during emergency cleanup
+            self._tty = sys.stdout.isatty()
+        except (AttributeError, ValueError):
+            self._tty = False
+
+        # Make sure the cursor is restored on exit or signals
+        _install_cleanup_handlers()
 
     def start(self):
         """Start the progress indicator"""
@@ -86,6 +185,8 @@ class ProgressIndicator:
             if self.running:
                 return  # Already running
             self.running = True
+            if not self._tty:
+                return
             # Hide cursor for cleaner display
             try:
                 sys.stdout.write("\033[?25l")
@@ -95,17 +196,16 @@ class ProgressIndicator:
                 # Handle cases where stdout isn't a terminal
                 pass
 
-        self.thread = threading.Thread(target=self._animate)
-        self.thread.daemon = True
-        self.thread.start()
+        # Show the first frame right away, the shared animation thread draws the rest
+        if self._render_frame():
+            _start_animating(self)
 
     def update(self, current=None, message=None):
-        """Update progress (thread-safe)"""
-        with self._lock:
-            if current is not None:
-                self.current = current
-            if message is not None:
-                self.message = message
+        """Update progress (thread-safe, each field is set with one atomic assignment)"""
+        if current is not None:
+            self.current = current
+        if message is not None:
+            self.message = message
 
     def stop(self, final_message=None):
         """Stop the progress indicator (thread-safe)"""
@@ -114,77 +214,65 @@ class ProgressIndicator:
                 return  # Already stopped
             self.running = False
 
-        if self.thread:
-            self.thread.join()
+        # Frames are drawn holding the lock and only while running, so no frame
+        # can follow the final message
+        _stop_animating(self)
 
         with self._lock:
             try:
-                # Clear the line completely using ANSI escape codes and show final message
-                sys.stdout.write("\033[2K\033[0G")  # Clear line and move to beginning
-                if final_message:
-                    sys.stdout.write(f"{Colors.GREEN}[OK]{Colors.RESET} {final_message}\n")
-                else:
-                    sys.stdout.write(f"{Colors.GREEN}[OK]{Colors.RESET} {self.message}\n")
-                sys.stdout.flush()
-                # Restore cursor
+                # Clear the line completely using ANSI escape codes and show final
+                # message, restoring the cursor in the same write
+                output = _OK_PREFIX + (final_message or self.message) + "\n"
+                if self._tty:
+                    output = "\033[2K\033[0G" + output  # Clear line and move to beginning
                 if self._cursor_hidden:
-                    sys.stdout.write("\033[?25h")
+                    output += "\033[?25h"
                     self._cursor_hidden = False
-                    sys.stdout.flush()
+                sys.stdout.write(output)
+                sys.stdout.flush()
             except (OSError, IOError):
                 # Handle cases where stdout isn't a terminal
                 pass
 
-        # Unregister from active indicators
-        try:
-            with ProgressIndicator._registry_lock:
-                ProgressIndicator._active_indicators.discard(self)
-        except Exception:
-            pass  # Ignore errors during cleanup
-
-    def _animate(self):
-        """Animation loop (thread-safe)"""
-        last_output_length = 0
-
-        while True:
-            # Check running status in a thread-safe way
-            with self._lock:
-                if not self.running:
-                    break
-                current_message = self.message
-                current_total = self.total
-                current_current = self.current
+    def _render_frame(self):
+        """Draw the current frame
+
+        Returns:
+            False if the indicator should no longer be animated
+        """
+        with self._lock:
+            if not self.running:
+                return False
+            # update() sets fields without the lock, so snapshot them once
+            current_message, current_total, current_current = self.message, self.total, self.current
 
             # Build the output string
             if current_total is not None:
                 # Progress bar mode - bar first for stability
                 percentage = (current_current / current_total) * 100 if current_total > 0 else 0
-                bar_length = 20
-                filled_length = int(bar_length * current_current // current_total) if current_total > 0 else 0
-                bar = "█" * filled_length + "░" * (bar_length - filled_length)
+                filled_length = int(_BAR_LENGTH * current_current // current_total) if current_total > 0 else 0
+                bar = _BARS[max(0, min(filled_length, _BAR_LENGTH))]
                 output = f"[{bar}] {percentage:.0f}% ({current_current}/{current_total}) {current_message}"
             else:
                 # Spinner mode
-                spinner = self.spinner_chars[self.spinner_index % len(self.spinner_chars)]
-                output = f"{Colors.CYAN}{spinner}{Colors.RESET} {current_message}"
-                self.spinner_index += 1
+                output = _SPINNER_FRAMES[self.spinner_index] + current_message
+                self.spinner_index = (self.spinner_index + 1) % len(_SPINNER_FRAMES)
 
-            try:
-                # Clear the previous line completely and write new output
-                # Calculate display length (excluding ANSI color codes)
-                display_length = len(re.sub(r'\x1b\[[0-9;]*m', '', output))
-                clear_length = max(last_output_length, display_length, 100)  # Ensure sufficient clearing
+            # A progress bar that hasn't moved needn't be redrawn (spinner
+            # frames always differ)
+            if output == self._last_output:
+                return True
 
+            try:
                 # Use ANSI escape codes for better terminal compatibility
                 # \033[2K clears the entire line, \033[0G moves cursor to beginning of line
                 sys.stdout.write(f"\033[2K\033[0G{output}")
                 sys.stdout.flush()
-                last_output_length = display_length
+                self._last_output = output
             except (OSError, IOError):
                 # Handle cases where stdout isn't a terminal
-                break
-
-            time.sleep(0.2)  # Slower animation to reduce flicker
+                return False
+            return True
 
     def __enter__(self):
         """Context manager entry - start progress indicator"""
@@ -215,6 +303,56 @@ def progress_wrapper(message, func, *args, **kwargs):
         raise
 
 
+class JsonStreamWriter:
+    """Write a JSON object incrementally, member by member
+
+    The output is identical to json.dumps(obj, indent=2) but each member is
+    written as soon as it is known, so large results don't have to be held
+    in memory and output starts before the whole object has been computed.
+    """
+
+    def __init__(self, stream=None, indent=2):
+        """Initialize the writer
+
+        Args:
+            stream: File-like object to write to (default: sys.stdout)
+            indent: Number of spaces per nesting level
+        """
+        self._stream = stream or sys.stdout
+        self._indent = indent
+        self._member_counts = []  # Members written so far at each open object level
+
+    def _member_prefix(self, key):
+        """Separator, newline and indentation before the next member"""
+        separator = "," if self._member_counts[-1] else ""
+        self._member_counts[-1] += 1
+        padding = " " * (self._indent * len(self._member_counts))
+        return f"{separator}\n{padding}{json.dumps(key)}: "
+
+    def start_object(self, key=None):
+        """Open a JSON object, nested under key when inside another object"""
+        if self._member_counts:
+            self._stream.write(self._member_prefix(key) + "{")
+        else:
+            self._stream.write("{")
+        self._member_counts.append(0)
+
+    def write_member(self, key, value):
+        """Write a complete key/value member into the current object"""
+        padding = " " * (self._indent * len(self._member_counts))
+        value_json = json.dumps(value, indent=self._indent).replace("\n", "\n" + padding)
+        self._stream.write(self._member_prefix(key) + value_json)
+
+    def end_object(self):
+        """Close the current JSON object"""
+        if self._member_counts.pop():
+            self._stream.write("\n" + " " * (self._indent * len(self._member_counts)))
+        self._stream.write("}")
+        if not self._member_counts:
+            self._stream.write("\n")
+        self._stream.flush()
+
+
 class PerformanceTimer:
     """Performance timing utility for measuring optimization improvements."""
 
@@ -227,20 +365,21 @@ class PerformanceTimer:
         """
         self.description = description
         self.show_logs = show_logs
+        # time.perf_counter_ns() readings
         self.start_time = None
         self.end_time = None
 
     def __enter__(self):
         """Start timing when entering context."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         if self.show_logs:
             print(f"{Colors.DIM}[..] Starting: {self.description}{Colors.RESET}")
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop timing when exiting context."""
-        self.end_time = time.time()
-        duration = self.end_time - self.start_time
+        self.end_time = time.perf_counter_ns()
+        duration = (self.end_time - self.start_time) / 1e9
 
         if self.show_logs:
             if duration < 1.0:
@@ -256,8 +395,8 @@ class PerformanceTimer:
         """
         if self.start_time is None:
             return None
-        end = self.end_time if self.end_time is not None else time.time()
-        return end - self.start_time
+        end = self.end_time if self.end_time is not None else time.perf_counter_ns()
+        return (end - self.start_time) / 1e9
 
 
 # Global subprocess call counter for performance monitoring
@@ -378,6 +517,27 @@ class BoxChars:
     ASCII_SEP = '+'
 
 
+@functools.lru_cache(maxsize=32)
+def _table_borders(widths, use_unicode):
+    """Build the top, header separator and bottom border lines for column widths
+
+    Tables are redrawn with the same widths over and over during a migration,
+    so the lines are cached.
+    """
+    if not use_unicode:
+        line = BoxChars.ASCII_CORNER + BoxChars.ASCII_SEP.join(
+            BoxChars.ASCII_HORIZONTAL * w for w in widths) + BoxChars.ASCII_CORNER
+        return line, line, line
+
+    heavy = [BoxChars.HEAVY_HORIZONTAL * w for w in widths]
+    light = [BoxChars.HORIZONTAL * w for w in widths]
+    return (
+        BoxChars.TOP_LEFT + BoxChars.TOP_SEP.join(heavy) + BoxChars.TOP_RIGHT,
+        BoxChars.HEADER_LEFT + BoxChars.HEADER_SEP.join(heavy) + BoxChars.HEADER_RIGHT,
+        BoxChars.BOTTOM_LEFT + BoxChars.BOTTOM_SEP.join(light) + BoxChars.BOTTOM_RIGHT,
+    )
+
+
 class TableFormatter:
     """Format data as a nicely bordered table"""
 
@@ -409,68 +569,44 @@ class TableFormatter:
         for row in rows:
             for i, cell in enumerate(row):
                 if i < len(widths):
-                    # Remove ANSI codes for width calculation
-                    clean_cell = re.sub(r'\x1b\[[0-9;]*m', '', str(cell))
-                    widths[i] = max(widths[i], len(clean_cell))
+                    # Ignore ANSI codes for width calculation
+                    widths[i] = max(widths[i], _visible_len(str(cell)))
 
         # Add padding
-        widths = [w + 2 for w in widths]
-
-        lines = []
-
-        # Top border
+        widths = tuple(w + 2 for w in widths)
+        top, header_separator, bottom = _table_borders(widths, self.use_unicode)
         if self.use_unicode:
-            segments = [self.box.HEAVY_HORIZONTAL * w for w in widths]
-            lines.append(self.box.TOP_LEFT + self.box.TOP_SEP.join(segments) + self.box.TOP_RIGHT)
+            header_vertical, vertical = BoxChars.HEAVY_VERTICAL, BoxChars.VERTICAL
         else:
-            segments = [self.ASCII_HORIZONTAL * w for w in widths]
-            lines.append(self.ASCII_CORNER + self.ASCII_SEP.join(segments) + self.ASCII_CORNER)
+            header_vertical = vertical = BoxChars.ASCII_VERTICAL
 
-        # Header row
-        header_cells = []
-        for i, header in enumerate(headers):
-            cell = f" {header.ljust(widths[i] - 2)} "
-            header_cells.append(cell)
+        lines = [top]
 
-        if self.use_unicode:
-            lines.append(self.box.HEAVY_VERTICAL + self.box.HEAVY_VERTICAL.join(header_cells) + self.box.HEAVY_VERTICAL)
-        else:
-            lines.append(self.ASCII_VERTICAL + self.ASCII_VERTICAL.join(header_cells) + self.ASCII_VERTICAL)
+        # Header row. Rows are joined with an empty cell at both ends, which
+        # puts the outer borders on in the same join
+        header_cells = ['']
+        for i, header in enumerate(headers):
+            header_cells.append(f" {header.ljust(widths[i] - 2)} ")
+        header_cells.append('')
+        lines.append(header_vertical.join(header_cells))
 
-        # Header separator
-        if self.use_unicode:
-            segments = [self.box.HEAVY_HORIZONTAL * w for w in widths]
-            lines.append(self.box.HEADER_LEFT + self.box.HEADER_SEP.join(segments) + self.box.HEADER_RIGHT)
-        else:
-            segments = [self.ASCII_HORIZONTAL * w for w in widths]
-            lines.append(self.ASCII_CORNER + self.ASCII_SEP.join(segments) + self.ASCII_CORNER)
+        lines.append(header_separator)
 
         # Data rows
         for row in rows:
-            row_cells = []
+            row_cells = ['']
             for i, cell in enumerate(row):
                 if i >= len(widths):
                     break
                 # Handle colored cells
                 cell_str = str(cell)
-                # Remove ANSI codes for padding calculation
-                clean_cell = re.sub(r'\x1b\[[0-9;]*m', '', cell_str)
-                padding = widths[i] - 2 - len(clean_cell)
-                padded_cell = f" {cell_str}{' ' * padding} "
-                row_cells.append(padded_cell)
-
-            if self.use_unicode:
-                lines.append(self.box.VERTICAL + self.box.VERTICAL.join(row_cells) + self.box.VERTICAL)
-            else:
-                lines.append(self.ASCII_VERTICAL + self.ASCII_VERTICAL.join(row_cells) + self.ASCII_VERTICAL)
+                # Ignore ANSI codes for padding calculation
+                padding = widths[i] - 2 - _visible_len(cell_str)
+                row_cells.append(f" {cell_str}{' ' * padding} ")
+            row_cells.append('')
+            lines.append(vertical.join(row_cells))
 
-        # Bottom border
-        if self.use_unicode:
-            segments = [self.box.HORIZONTAL * w for w in widths]
-            lines.append(self.box.BOTTOM_LEFT + self.box.BOTTOM_SEP.join(segments) + self.box.BOTTOM_RIGHT)
-        else:
-            segments = [self.ASCII_HORIZONTAL * w for w in widths]
-            lines.append(self.ASCII_CORNER + self.ASCII_SEP.join(segments) + self.ASCII_CORNER)
+        lines.append(bottom)
 
         return '\n'.join(lines)
 
@@ -538,14 +674,13 @@ class ProgressTable:
         table_output = self.formatter.format_table(self.headers, ordered_rows)
         lines = table_output.split('\n')
 
-        if clear_previous and self._table_drawn:
-            # Clear previous output
-            for _ in range(self._last_output_lines):
-                sys.stdout.write("\033[A\033[2K")  # Move up and clear line
+        output = ""
+        if clear_previous and self._table_drawn and self._last_output_lines:
+            # Move up to the start of the previous output and clear to end of screen
+            output = f"\033[{self._last_output_lines}A\033[J"
 
-        # Output new table
-        for line in lines:
-            print(line)
+        # Output new table, together with the clearing, in a single write
+        sys.stdout.write(output + "\n".join(lines) + "\n")
 
         self._last_output_lines = len(lines)
         self._table_drawn = True
@@ -568,7 +703,7 @@ class MigrationTable:
             apps_without_matches: List of app names without Homebrew matches
         """
         self.apps_with_matches = sorted(apps_with_matches, key=lambda x: x[0].lower())
-        self.apps_without_matches = sorted(apps_without_matches or [], key=lambda x: x.lower())
+        self.apps_without_matches = sorted(apps_without_matches or [], key=str.lower)
 
         # Track checkbox states and status for each app
         self.checkboxes = {}  # app_name -> bool (selected)
@@ -584,6 +719,16 @@ class MigrationTable:
         self._last_output_lines = 0
         self._header_printed = False
         self._saved_cursor_pos = False
+        # Serializes progress redraws from concurrent migrations
+        self._render_lock = threading.Lock()
+        # app_name -> (row state, cells); only rows whose state changed are rebuilt
+        self._row_cache = {}
+        self._formatter = TableFormatter()
+        # Where the last render put each row and the status column, for updating
+        # a single status in place: app_name -> lines below the saved cursor
+        self._row_offsets = {}
+        self._status_column = 0  # 1-based screen column of the status text
+        self._status_width = 0
 
     def select_apps(self, indices, update_display=True):
         """Mark apps as selected based on indices
@@ -616,6 +761,63 @@ class MigrationTable:
         if app_name in self.statuses:
             self.statuses[app_name] = status
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _color_status(status):
+        """Color a status string for the status column
+
+        Only a handful of distinct statuses (plus the percentages) ever occur,
+        so each is classified and colored once.
+        """
+        if status == "Ready":
+            return status
+        elif status == "Queue" or "⏸" in status:
+            return f"{Colors.YELLOW}{status}{Colors.RESET}"
+        elif status == "Removing":
+            return f"{Colors.YELLOW}{status}{Colors.RESET}"
+        elif "%" in status or "⟳" in status:
+            return f"{Colors.CYAN}{status}{Colors.RESET}"
+        elif "✓" in status or "Done" in status:
+            return f"{Colors.GREEN}{status}{Colors.RESET}"
+        elif "✗" in status or "Failed" in status:
+            return f"{Colors.YELLOW}{status}{Colors.RESET}"
+        elif "DEPRECATED" in status or "DISABLED" in status:
+            return f"{Colors.ORANGE}{status}{Colors.RESET}"
+        elif status == "-":
+            return f"{Colors.DIM}{status}{Colors.RESET}"
+        return status
+
+    def _build_row(self, index, app_name, cask_name, show_selection_prompt):
+        """Build the table cells for one app"""
+        # Checkbox column
+        if show_selection_prompt:
+            checkbox = f"{StatusIcons.CHECKBOX_EMPTY} {index}"
+        else:
+            checkbox = f"{StatusIcons.CHECKBOX_CHECKED if self.checkboxes[app_name] else StatusIcons.CHECKBOX_EMPTY} {index}"
+
+        # Status with colors
+        status_colored = self._color_status(self.statuses[app_name])
+
+        # Highlight deprecated/disabled packages in the cask name column
+        cask_display = cask_name
+        if "[DEPRECATED" in cask_name or "[DISABLED" in cask_name:
+            cask_display = f"{Colors.ORANGE}{cask_name}{Colors.RESET}"
+
+        # Build row - show dash for unchecked items in selection mode
+        if not self.checkboxes[app_name] and not show_selection_prompt:
+            return [
+                f"  {Colors.DIM}-{Colors.RESET}",
+                app_name,
+                f"{Colors.DIM}-{Colors.RESET}",
+                status_colored
+            ]
+        return [
+            checkbox,
+            app_name,
+            cask_display,
+            status_colored
+        ]
+
     def render(self, title="", show_selection_prompt=False, clear_previous=True):
         """Render the migration table
 
@@ -624,69 +826,29 @@ class MigrationTable:
             show_selection_prompt: Whether to show selection numbers
             clear_previous: Whether to clear previous output
         """
-        # Build table rows
+        # Build table rows, reusing the cells of rows whose state hasn't changed
         table_rows = []
         for i, (app_name, cask_name) in enumerate(self.apps_with_matches, 1):
-            # Checkbox column
-            if show_selection_prompt:
-                checkbox = f"{StatusIcons.CHECKBOX_EMPTY} {i}"
-            else:
-                checkbox = f"{StatusIcons.CHECKBOX_CHECKED if self.checkboxes[app_name] else StatusIcons.CHECKBOX_EMPTY} {i}"
-
-            # Status with colors
-            status = self.statuses[app_name]
-            if status == "Ready":
-                status_colored = status
-            elif status == "Queue" or "⏸" in status:
-                status_colored = f"{Colors.YELLOW}{status}{Colors.RESET}"
-            elif status == "Removing":
-                status_colored = f"{Colors.YELLOW}{status}{Colors.RESET}"
-            elif "%" in status or "⟳" in status:
-                status_colored = f"{Colors.CYAN}{status}{Colors.RESET}"
-            elif "✓" in status or "Done" in status:
-                status_colored = f"{Colors.GREEN}{status}{Colors.RESET}"
-            elif "✗" in status or "Failed" in status:
-                status_colored = f"{Colors.YELLOW}{status}{Colors.RESET}"
-            elif "DEPRECATED" in status or "DISABLED" in status:
-                status_colored = f"{Colors.ORANGE}{status}{Colors.RESET}"
-            elif status == "-":
-                status_colored = f"{Colors.DIM}{status}{Colors.RESET}"
-            else:
-                status_colored = status
-
-            # Highlight deprecated/disabled packages in the cask name column
-            cask_display = cask_name
-            if "[DEPRECATED" in cask_name or "[DISABLED" in cask_name:
-                cask_display = f"{Colors.ORANGE}{cask_name}{Colors.RESET}"
-
-            # Build row - show dash for unchecked items in selection mode
-            if not self.checkboxes[app_name] and not show_selection_prompt:
-                table_rows.append([
-                    f"  {Colors.DIM}-{Colors.RESET}",
-                    app_name,
-                    f"{Colors.DIM}-{Colors.RESET}",
-                    status_colored
-                ])
-            else:
-                table_rows.append([
-                    checkbox,
-                    app_name,
-                    cask_display,
-                    status_colored
-                ])
+            state = (self.statuses[app_name], self.checkboxes[app_name], show_selection_prompt)
+            cached = self._row_cache.get(app_name)
+            if cached is None or cached[0] != state:
+                cached = (state, self._build_row(i, app_name, cask_name, show_selection_prompt))
+                self._row_cache[app_name] = cached
+            table_rows.append(cached[1])
+
+        # Everything is written in one go at the end, escape sequences included
+        output = ""
 
         # Save cursor position on first render
         if self._last_output_lines == 0:
-            sys.stdout.write("\033[s")  # Save cursor position
-            sys.stdout.flush()
+            output += "\033[s"  # Save cursor position
             self._saved_cursor_pos = True
 
         # Clear previous output if requested and table was already drawn
         if clear_previous and self._last_output_lines > 0 and self._saved_cursor_pos:
             # Restore to saved cursor position and clear from there
-            sys.stdout.write("\033[u")  # Restore cursor position
-            sys.stdout.write("\033[J")  # Clear from cursor to end of screen
-            sys.stdout.flush()
+            output += "\033[u"  # Restore cursor position
+            output += "\033[J"  # Clear from cursor to end of screen
 
         # Build the output lines
         lines = []
@@ -696,14 +858,23 @@ class MigrationTable:
             lines.append(title)
 
         # Format table
-        formatter = TableFormatter()
-        table = formatter.format_table(
+        table = self._formatter.format_table(
             headers=["#", "App", "Target", "Status"],
             rows=table_rows
         )
 
-        for line in table.split('\n'):
-            lines.append(line)
+        table_lines = table.split('\n')
+        lines.extend(table_lines)
+
+        # Remember the layout: the header row is the 2nd table line and the app
+        # rows start at the 4th, in table order
+        first_row = len(lines) - len(table_lines) + 3
+        self._row_offsets = {
+            app_name: first_row + i for i, (app_name, _) in enumerate(self.apps_with_matches)
+        }
+        header_cells = table_lines[1].split(BoxChars.HEAVY_VERTICAL)
+        self._status_column = len(BoxChars.HEAVY_VERTICAL) * 4 + sum(len(c) for c in header_cells[1:4]) + 2
+        self._status_width = len(header_cells[4]) - 2
 
         # Add "No matches" line if there are any
         if self.apps_without_matches:
@@ -714,8 +885,7 @@ class MigrationTable:
             lines.append(f"{Colors.DIM}No matches: {no_match_names} ({len(self.apps_without_matches)} apps){Colors.RESET}")
 
         # Print all lines
-        for line in lines:
-            print(line)
+        sys.stdout.write(output + "\n".join(lines) + "\n")
 
         self._last_output_lines = len(lines)
         sys.stdout.flush()
@@ -740,8 +910,46 @@ class MigrationTable:
         )
 
     def render_progress(self, title="[MIGRATION] Processing packages..."):
-        """Render table showing migration progress"""
-        self.render(title=title, show_selection_prompt=False)
+        """Render table showing migration progress (safe to call from several threads)"""
+        with self._render_lock:
+            self.render(title=title, show_selection_prompt=False)
+
+    def update_status_live(self, app_name, status):
+        """Update an app's status and redraw only its status cell (thread safe)
+
+        Meant for frequent updates like download percentages while nothing else
+        is printed below the table. Falls back to a full progress render when
+        the table hasn't been drawn yet or the new status doesn't fit the
+        status column as last drawn.
+        """
+        with self._render_lock:
+            self.update_status(app_name, status)
+            offset = self._row_offsets.get(app_name)
+            width = _visible_len(status)
+            if not self._saved_cursor_pos or offset is None or width > self._status_width:
+                self.render(title="[MIGRATION] Processing packages...", show_selection_prompt=False)
+                return
+
+            # Jump to the cell from the saved cursor position, rewrite it, then
+            # return to the line below the output where a full render leaves it
+            sys.stdout.write(
+                f"\033[u\033[{offset}B\033[{self._status_column}G"
+                f"{self._color_status(status)}{' ' * (self._status_width - width)}"
+                f"\033[u\033[{self._last_output_lines}B\r"
+            )
+            sys.stdout.flush()
+
+
+# Blanks out a status line of up to _STATUS_CLEAR_WIDTH characters
+_STATUS_CLEAR_WIDTH = 100
+_STATUS_CLEAR = "\r" + " " * _STATUS_CLEAR_WIDTH + "\r"
+
+
+def _status_clear(length):
+    """Return the string that blanks a status line of the given length"""
+    if length <= _STATUS_CLEAR_WIDTH:
+        return _STATUS_CLEAR
+    return f"\r{' ' * length}\r"
 
 
 class StatusLine:
@@ -777,8 +985,7 @@ class StatusLine:
             colored_message = message
 
         # Clear previous message and write new one
-        clear_length = max(self._last_message_length, len(message), 100)
-        sys.stdout.write(f"\r{' ' * clear_length}\r{colored_message}")
+        sys.stdout.write(_status_clear(max(self._last_message_length, len(message))) + colored_message)
         sys.stdout.flush()
 
         self._last_message_length = len(message)
@@ -787,7 +994,7 @@ class StatusLine:
     def clear(self):
         """Clear the status line"""
         if self._visible:
-            sys.stdout.write(f"\r{' ' * max(self._last_message_length, 100)}\r")
+            sys.stdout.write(_status_clear(self._last_message_length))
             sys.stdout.flush()
             self._last_message_length = 0
             self._visible = False